@@ -0,0 +1,192 @@
+"""Asset preloading off the main thread, and the loading screen that waits on it.
+
+Reading files, decoding PNGs and decoding MP3s into mixer Sounds happen on
+a small thread pool.  Converting a decoded image to the display format
+has to happen on the main thread once the display exists, so
+AssetLoader.poll() does that part a few milliseconds at a time, between
+frames of the LoadingScreen, and puts the results in the same registries
+load_photos and load_sound read from.  Scenes built after a batch has
+finished therefore find every asset already cached.
+
+Assets are (kind, name) pairs:
+
+    ("atlas", None)         every gameplay sprite, packed into the sprite atlas
+    ("photo", name)         an opaque image, as load_photos(name, False)
+    ("background", name)    an opaque image pre-scaled by load_background
+    ("sound", name)         a decoded sound effect, as load_sound(name)
+
+Levels list theirs with level_engine.level_assets; the game-over screen
+hands the next level's list to prefetch() so it decodes while the player
+reads their score.
+"""
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from atlas import ATLAS_SPRITES, atlas_loaded, get_atlas
+from ui_cache import get_font, render_text_cached
+from utils import (SCREEN_WIDTH, SCREEN_HEIGHT, install_photo, install_sound, load_background,
+                   photo_loaded, sound_loaded)
+
+LOADER_THREADS = 4
+CONVERT_BUDGET_MS = 8  # Main-thread conversion per poll, so the loading screen keeps drawing
+PROGRESS_BAR = pygame.Rect(SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2 + 10, 400, 24)
+
+
+def _read_image(name):
+    path = f"./assets/photos/{name}.png"
+    with open(path, "rb") as image_file:
+        return pygame.image.load(io.BytesIO(image_file.read()), path)
+
+
+def _decode(kind, name):
+    """Worker-thread half of loading an asset: file I/O and decoding only."""
+    if kind == "atlas":
+        return {sprite: _read_image(sprite) for sprite in ATLAS_SPRITES}
+    if kind in ("photo", "background"):
+        return _read_image(name)
+    if kind == "sound":
+        with open(f"./assets/sounds/{name}.mp3", "rb") as sound_file:
+            return pygame.mixer.Sound(io.BytesIO(sound_file.read()))
+    raise ValueError(f"unknown asset kind: {kind!r}")
+
+
+def _loaded(kind, name):
+    if kind == "atlas":
+        return atlas_loaded()
+    if kind == "sound":
+        return sound_loaded(name)
+    return photo_loaded(name, False)
+
+
+def _install(kind, name, decoded):
+    """Main-thread half: convert for the display and register with the caches."""
+    if kind == "atlas":
+        get_atlas(decoded)
+    elif kind == "sound":
+        install_sound(name, decoded)
+    else:
+        install_photo(name, decoded, False)
+        if kind == "background":
+            load_background(name)
+
+
+class AssetBatch:
+    """The assets one scene is waiting for, with how many are ready."""
+    def __init__(self, items):
+        self.pending = items  # [((kind, name), future), ...]
+        self.total = len(items)
+        self.loaded = 0
+
+    @property
+    def done(self):
+        return not self.pending
+
+    @property
+    def progress(self):
+        return self.loaded / self.total if self.total else 1.0
+
+
+class AssetLoader:
+    def __init__(self, threads=LOADER_THREADS):
+        self.executor = ThreadPoolExecutor(threads, thread_name_prefix="assets")
+        # Decodes in flight or finished but not yet installed; a prefetch and
+        # the load that follows it share one future per asset
+        self.futures = {}
+
+    def submit(self, assets):
+        """Start decoding whatever in `assets` is not cached yet; returns their (key, future) pairs."""
+        items = []
+        for key in assets:
+            if _loaded(*key):
+                continue
+            future = self.futures.get(key)
+            if future is None:
+                future = self.futures[key] = self.executor.submit(_decode, *key)
+            items.append((key, future))
+        return items
+
+    def prefetch(self, assets):
+        """Decode `assets` in the background; a later preload() of them only has to convert."""
+        self.submit(assets)
+
+    def preload(self, assets):
+        return AssetBatch(self.submit(assets))
+
+    def poll(self, batch, budget_ms=CONVERT_BUDGET_MS):
+        """Install the batch's decoded assets for up to `budget_ms`; True once all are in."""
+        deadline = time.perf_counter() + budget_ms / 1000
+        still_pending = []
+        for key, future in batch.pending:
+            if not future.done() or time.perf_counter() > deadline:
+                still_pending.append((key, future))
+                continue
+            self.futures.pop(key, None)
+            if not _loaded(*key):
+                try:
+                    _install(*key, future.result())
+                except (pygame.error, OSError):
+                    # Leave it to the synchronous loaders, which report missing files themselves
+                    pass
+            batch.loaded += 1
+        batch.pending = still_pending
+        return batch.done
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def with_loading_screen(game, assets, factory):
+    """Wrap a scene factory so `assets` load behind a LoadingScreen first.
+
+    Falls straight through to `factory` when the game has no loader or
+    everything is already cached.
+    """
+    loader = getattr(game, "assets", None)
+    if loader is None:
+        return factory
+
+    def build():
+        batch = loader.preload(assets)
+        if batch.done:
+            return factory()
+        return LoadingScreen(game, batch, factory)
+    return build
+
+
+#############################################################################
+
+
+class LoadingScreen:
+    """A progress bar shown until a batch is installed, then replaced by its scene."""
+    idle = False  # Polls the loader every frame
+
+    def __init__(self, game, batch, factory, title="Loading..."):
+        self.game = game
+        self.batch = batch
+        self.factory = factory
+        self.title = title
+        self.font = get_font("Arial", 40, bold=True)
+        self.finished = False
+
+    def handle_input(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.game.scenes.quit()
+
+    def update(self, dt=None):
+        if not self.finished and self.game.assets.poll(self.batch):
+            self.finished = True
+            self.game.scenes.switch(self.factory)
+
+    def draw(self, screen):
+        screen.fill((0, 0, 0))
+        title = render_text_cached(self.font, self.title, (255, 255, 255))
+        screen.blit(title, title.get_rect(midbottom=(SCREEN_WIDTH // 2, PROGRESS_BAR.top - 20)))
+        pygame.draw.rect(screen, (255, 255, 255), PROGRESS_BAR, 2)
+        filled = PROGRESS_BAR.inflate(-8, -8)
+        filled.width = round(filled.width * self.batch.progress)
+        pygame.draw.rect(screen, (255, 165, 0), filled)
+        pygame.display.flip()
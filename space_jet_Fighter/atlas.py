@@ -0,0 +1,84 @@
+"""One packed texture for every gameplay sprite.
+
+The plane poses, enemy, bomb, ammo drop, heart and cursor images are
+packed into a single converted surface, shelf by shelf, and each one is
+handed out as a subsurface of it.  Every sprite the levels draw therefore
+reads from the same pixels, and switching the plane's banking pose only
+swaps which sub-rect is blitted.
+
+Derived sprites (scaled or rotated copies) are listed in ATLAS_VARIANTS
+and packed alongside the originals at build time, so no transform ever
+runs during play.  The atlas is built lazily on first use because it
+needs a display to convert against.
+"""
+import pygame
+
+ATLAS_SPRITES = ("plane_center", "plane_left", "plane_right", "enemy_plane",
+                 "bomb", "ammo_drop", "lives", "cursor")
+# name -> (source sprite, transform), e.g. "lives_small": ("lives", lambda s: pygame.transform.smoothscale_by(s, 0.5))
+ATLAS_VARIANTS = {}
+ATLAS_WIDTH = 512
+ATLAS_PADDING = 1  # Transparent gap so filtered or scaled blits never bleed into a neighbour
+
+
+class SpriteAtlas:
+    def __init__(self, images, width=ATLAS_WIDTH, padding=ATLAS_PADDING):
+        """Pack {name: Surface} into one surface; tallest images first, left to right in shelves."""
+        self.rects = {}
+        x = y = shelf_height = 0
+        for name, image in sorted(images.items(), key=lambda item: -item[1].get_height()):
+            w, h = image.get_size()
+            if x and x + w > width:
+                x, y = 0, y + shelf_height + padding
+                shelf_height = 0
+            self.rects[name] = pygame.Rect(x, y, w, h)
+            x += w + padding
+            shelf_height = max(shelf_height, h)
+
+        packed = pygame.Surface((max(width, max(rect.right for rect in self.rects.values())),
+                                 y + shelf_height), pygame.SRCALPHA)
+        for name, rect in self.rects.items():
+            # BLEND_RGBA_MAX onto the cleared surface copies the pixels exactly, alpha included
+            packed.blit(images[name], rect, special_flags=pygame.BLEND_RGBA_MAX)
+        self.surface = packed.convert_alpha()
+        self.sprites = {name: self.surface.subsurface(rect) for name, rect in self.rects.items()}
+
+    @classmethod
+    def load(cls, names=ATLAS_SPRITES, variants=None, images=None):
+        """Build the atlas from disk; `images` supplies already decoded sprites by name."""
+        images = dict(images or {})
+        for name in names:
+            if name not in images:
+                images[name] = pygame.image.load(f"./assets/photos/{name}.png")
+        for name, (source, transform) in (ATLAS_VARIANTS if variants is None else variants).items():
+            images[name] = transform(images[source])
+        return cls(images)
+
+    def __contains__(self, name):
+        return name in self.sprites
+
+    def __getitem__(self, name):
+        return self.sprites[name]
+
+    def rect(self, name):
+        return self.rects[name]
+
+
+_atlas = None
+
+
+def get_atlas(images=None):
+    """Return the shared atlas, building it on first use (from `images` where given)."""
+    global _atlas
+    if _atlas is None:
+        _atlas = SpriteAtlas.load(images=images)
+    return _atlas
+
+
+def atlas_loaded():
+    return _atlas is not None
+
+
+def clear_atlas():
+    global _atlas
+    _atlas = None
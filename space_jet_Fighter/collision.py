@@ -0,0 +1,134 @@
+"""Broad-phase collision helpers shared by every level.
+
+Enemies are bucketed into a uniform grid so each bomb is only tested
+against the enemies in the cells it overlaps, instead of every enemy on
+screen.  Removals are done by rebuilding lists once per frame rather than
+calling list.remove inside the loops.
+
+Pixel-perfect tests compare the sprites' cached masks (utils.get_mask),
+and only for pairs whose rects already overlap.
+"""
+from collections import defaultdict
+
+import pygame
+
+from utils import bombs_hit_enemy_triangles, get_mask
+
+CELL_SIZE = 160  # Roughly one enemy sprite; bombs overlap at most two cells
+BRUTE_FORCE_LIMIT = 40000  # Below this many bomb/enemy pairs a plain scan is cheaper
+EMPTY_RECT = pygame.Rect(0, 0, 0, 0)
+
+
+class SpatialHash:
+    """Uniform grid mapping cell coordinates to the indices inserted there."""
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        return (range(rect.left // size, (rect.right - 1) // size + 1),
+                range(rect.top // size, (rect.bottom - 1) // size + 1))
+
+    def insert(self, index, rect):
+        columns, rows = self._cell_range(rect)
+        for cx in columns:
+            for cy in rows:
+                self.cells[(cx, cy)].append(index)
+
+    def query(self, rect):
+        """Return the sorted indices whose cells overlap `rect`."""
+        columns, rows = self._cell_range(rect)
+        cells = self.cells
+        found = set()
+        for cx in columns:
+            for cy in rows:
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found)
+
+
+#############################################################################
+
+
+def resolve_bomb_hits(bombs, enemies, hitbox="rect", cell_size=CELL_SIZE):
+    """Pair each bomb with the first enemy it hits.
+
+    Bombs are resolved in list order and each enemy can only be hit once,
+    which matches the old nested-loop behaviour.  `hitbox` selects the narrow
+    phase run on the rect overlaps: "rect" keeps them as they are, "triangle"
+    uses the enemy's triangular outline (utils.bomb_collides_with_enemy) and
+    "mask" requires opaque pixels of both sprites to overlap.
+    Returns (bomb, enemy) pairs.
+    """
+    if not bombs or not enemies:
+        return []
+
+    if hitbox == "rect":
+        if len(bombs) * len(enemies) <= BRUTE_FORCE_LIMIT:
+            # Small waves: let Rect.collidelist do the scan in C.  Destroyed
+            # enemies are swapped for an empty rect, which never collides.
+            rects = [enemy.rect for enemy in enemies]
+            hits = []
+            for bomb in bombs:
+                index = bomb.rect.collidelist(rects)
+                if index != -1:
+                    rects[index] = EMPTY_RECT
+                    hits.append((bomb, enemies[index]))
+            return hits
+        pairs = candidate_pairs(bombs, enemies, cell_size)
+    elif hitbox == "triangle":
+        pairs = candidate_pairs(bombs, enemies, cell_size)
+        hit = bombs_hit_enemy_triangles([bombs[b] for b, _ in pairs], [enemies[e] for _, e in pairs])
+        pairs = [pair for pair, is_hit in zip(pairs, hit) if is_hit]
+    elif hitbox == "mask":
+        pairs = [(b, e) for b, e in candidate_pairs(bombs, enemies, cell_size) if masks_overlap(bombs[b], enemies[e])]
+    else:
+        raise ValueError(f"unknown hitbox: {hitbox!r}")
+
+    hits = []
+    hit_bombs = set()
+    destroyed = set()
+    for bomb_index, enemy_index in pairs:
+        if bomb_index not in hit_bombs and enemy_index not in destroyed:
+            hit_bombs.add(bomb_index)
+            destroyed.add(enemy_index)
+            hits.append((bombs[bomb_index], enemies[enemy_index]))
+    return hits
+
+
+def candidate_pairs(bombs, enemies, cell_size=CELL_SIZE):
+    """Return every (bomb_index, enemy_index) whose rects overlap, sorted."""
+    rects = [enemy.rect for enemy in enemies]
+    if len(bombs) * len(enemies) <= BRUTE_FORCE_LIMIT:
+        return [(b, e) for b, bomb in enumerate(bombs) for e in bomb.rect.collidelistall(rects)]
+
+    grid = SpatialHash(cell_size)
+    for index, rect in enumerate(rects):
+        grid.insert(index, rect)
+    return [(b, e) for b, bomb in enumerate(bombs) for e in grid.query(bomb.rect)
+            if bomb.rect.colliderect(rects[e])]
+
+
+def masks_overlap(a, b):
+    """True if the opaque pixels of two GameObjects' sprites touch at their current rects."""
+    return get_mask(a.sprite).overlap(get_mask(b.sprite), (b.rect.x - a.rect.x, b.rect.y - a.rect.y)) is not None
+
+
+def collect_ammo_drops(ammo_drops, player, hitbox="rect"):
+    """Return the ammo drops touching the player: by rect, or by sprite pixels with hitbox="mask"."""
+    if not ammo_drops:
+        return []
+    touching = [ammo_drops[i] for i in player.rect.collidelistall([drop.rect for drop in ammo_drops])]
+    if hitbox == "mask":
+        return [drop for drop in touching if masks_overlap(player, drop)]
+    return touching
+
+
+def without(objects, removed):
+    """Return `objects` minus everything in the `removed` collection."""
+    if not removed:
+        return objects
+    removed = set(removed)
+    return [obj for obj in objects if obj not in removed]
@@ -0,0 +1,275 @@
+"""Optional array-backed storage for enemies, bombs and ammo drops.
+
+Positions, velocities, sizes, an alive mask and the entity kind live in
+contiguous NumPy arrays, so a whole wave moves, culls and collides with a
+handful of vectorised operations instead of one Python call per object.
+Dead rows are compacted with swap-remove: live rows from the tail are
+copied into the holes, so compaction costs O(dead) rather than shifting
+the whole store.
+
+Each entity is handed out as a thin view (EnemyPlaneView, BombView,
+AmmoDropView) with the rect, sprite, layer, speed and draw_position of
+the models classes, so the level lists, the renderer, the HUD and the
+autopilot treat them like GameObjects.  A Level built with
+entity_store=True keeps its entities here; by default levels use the
+pooled GameObjects from models.  NumPy is an optional dependency, and
+EntityStore raises ImportError when it is missing.
+"""
+import pygame
+
+from collision import masks_overlap
+from render_queue import LAYER_AMMO_DROPS, LAYER_BOMBS, LAYER_ENEMIES
+from timing import BASE_FPS, FRAME_DT
+from utils import SCREEN_HEIGHT
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+KIND_ENEMY = 0
+KIND_BOMB = 1
+KIND_AMMO_DROP = 2
+PAIR_CHUNK = 1 << 20  # Bomb/enemy pairs tested per broadcast, to bound the temporary arrays
+
+
+class EntityView:
+    """Thin handle onto one row of an EntityStore, shaped like models.GameObject.
+
+    The row changes when compaction moves the entity; it is -1 once the
+    entity has been removed.  Movement happens in EntityStore.step.
+    """
+    __slots__ = ("store", "row", "sprite")
+    layer = None
+
+    def __init__(self, store, row, sprite):
+        self.store = store
+        self.row = row
+        self.sprite = sprite
+
+    @property
+    def alive(self):
+        return self.row >= 0
+
+    @property
+    def rect(self):
+        store, row = self.store, self.row
+        return pygame.Rect(int(store.x[row]), int(store.y[row]), int(store.w[row]), int(store.h[row]))
+
+    @property
+    def speed(self):
+        return abs(float(self.store.vy[self.row]))
+
+    def draw_position(self, alpha=1.0):
+        store, row = self.store, self.row
+        x, y = int(store.x[row]), int(store.y[row])
+        if alpha >= 1.0:
+            return (x, y)
+        x0, y0 = int(store.prev_x[row]), int(store.prev_y[row])
+        return (round(x0 + (x - x0) * alpha), round(y0 + (y - y0) * alpha))
+
+    def draw(self, renderer, alpha=1.0):
+        renderer.submit(self.sprite, self.draw_position(alpha), self.layer)
+
+
+class EnemyPlaneView(EntityView):
+    __slots__ = ()
+    layer = LAYER_ENEMIES
+
+
+class BombView(EntityView):
+    __slots__ = ()
+    layer = LAYER_BOMBS
+
+
+class AmmoDropView(EntityView):
+    __slots__ = ()
+    layer = LAYER_AMMO_DROPS
+
+
+VIEW_CLASSES = {KIND_ENEMY: EnemyPlaneView, KIND_BOMB: BombView, KIND_AMMO_DROP: AmmoDropView}
+
+
+#############################################################################
+
+
+class EntityStore:
+    """Struct-of-arrays container for every moving entity in a level.
+
+    Rows [0, count) are always live between calls: the methods that remove
+    entities compact before they return.
+    """
+    ARRAYS = {
+        "x": "float32", "y": "float32", "prev_x": "float32", "prev_y": "float32",
+        "vx": "float32", "vy": "float32", "w": "int32", "h": "int32",
+        "alive": "bool", "kind": "int8",
+    }
+
+    def __init__(self, capacity=256):
+        if np is None:
+            raise ImportError("EntityStore requires numpy")
+        self.count = 0
+        self.views = []  # row -> view
+        self.x = None
+        self._allocate(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _allocate(self, capacity):
+        resized = self.x is not None
+        for name, dtype in self.ARRAYS.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if resized:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def spawn(self, kind, sprite, topleft, speed):
+        """Add an entity moving `speed` px per 60 FPS frame (negative is up) and return its view."""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        row = self.count
+        self.x[row] = self.prev_x[row] = topleft[0]
+        self.y[row] = self.prev_y[row] = topleft[1]
+        self.vx[row], self.vy[row] = 0, speed
+        self.w[row], self.h[row] = sprite.get_size()
+        self.alive[row] = True
+        self.kind[row] = kind
+        self.count += 1
+        view = VIEW_CLASSES[kind](self, row, sprite)
+        self.views.append(view)
+        return view
+
+    def step(self, dt=FRAME_DT):
+        """Advance every entity by its velocity, remembering where it was for interpolation."""
+        n = self.count
+        scale = dt * BASE_FPS
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += self.vx[:n] * scale
+        self.y[:n] += self.vy[:n] * scale
+
+    def _edges(self, rows):
+        """Integer left/top/right/bottom of `rows`, as their view rects would report."""
+        left = self.x[rows].astype(np.int32)
+        top = self.y[rows].astype(np.int32)
+        return left, top, left + self.w[rows], top + self.h[rows]
+
+    def _rows(self, kind):
+        return np.flatnonzero(self.kind[:self.count] == kind)
+
+    def kill_rows(self, rows):
+        """Remove `rows` and return their views, in row order."""
+        if len(rows) == 0:
+            return []
+        dead = [self.views[row] for row in rows]
+        self.alive[rows] = False
+        self.compact()
+        return dead
+
+    def kill(self, views):
+        """Remove the entities behind `views`."""
+        self.kill_rows(np.array([view.row for view in views if view.row >= 0], dtype=np.intp))
+
+    def compact(self):
+        """Swap-remove every dead row: live tail rows are copied into the holes."""
+        n = self.count
+        dead = ~self.alive[:n]
+        removed = int(np.count_nonzero(dead))
+        if not removed:
+            return
+        keep = n - removed
+        holes = np.flatnonzero(dead[:keep])
+        movers = np.flatnonzero(~dead[keep:]) + keep  # As many live tail rows as there are holes
+        for row in np.flatnonzero(dead):
+            self.views[row].row = -1
+        for name in self.ARRAYS:
+            array = getattr(self, name)
+            array[holes] = array[movers]
+        views = self.views
+        for hole, mover in zip(holes.tolist(), movers.tolist()):
+            views[hole] = views[mover]
+            views[hole].row = hole
+        del views[keep:]
+        self.count = keep
+
+    #########################################################################
+
+    def cull_offscreen(self, height=SCREEN_HEIGHT):
+        """Remove what left the screen; returns (escaped enemies, spent bombs, missed ammo drops).
+
+        The edges match the list-based levels: enemies escape once their top
+        is below the screen, bombs are spent once their bottom is above it
+        and ammo drops are missed once their bottom passes the bottom edge.
+        """
+        n = self.count
+        kind = self.kind[:n]
+        _, top, _, bottom = self._edges(slice(0, n))
+        escaped = (kind == KIND_ENEMY) & (top > height)
+        spent = (kind == KIND_BOMB) & (bottom < 0)
+        missed = (kind == KIND_AMMO_DROP) & (bottom > height)
+        gone = np.flatnonzero(escaped | spent | missed)
+        if len(gone) == 0:
+            return [], [], []
+        groups = {KIND_ENEMY: [], KIND_BOMB: [], KIND_AMMO_DROP: []}
+        for row, row_kind in zip(gone.tolist(), kind[gone].tolist()):
+            groups[row_kind].append(self.views[row])
+        self.kill_rows(gone)
+        return groups[KIND_ENEMY], groups[KIND_BOMB], groups[KIND_AMMO_DROP]
+
+    def bomb_hits(self, hitbox="rect"):
+        """Pair each bomb with the first enemy it hits, remove both and return the (bomb, enemy) views.
+
+        Rect overlaps are found with broadcast comparisons, PAIR_CHUNK pairs
+        at a time.  Bombs are resolved in row order and each enemy can only
+        be hit once; hitbox="mask" also requires the sprites' opaque pixels
+        to touch.
+        """
+        bombs, enemies = self._rows(KIND_BOMB), self._rows(KIND_ENEMY)
+        if len(bombs) == 0 or len(enemies) == 0:
+            return []
+        bl, bt, br, bb = self._edges(bombs)
+        el, et, er, eb = self._edges(enemies)
+        chunk = max(1, PAIR_CHUNK // len(enemies))
+        hits = []
+        destroyed = set()
+        for start in range(0, len(bombs), chunk):
+            end = start + chunk
+            overlap = ((bl[start:end, None] < er) & (br[start:end, None] > el)
+                       & (bt[start:end, None] < eb) & (bb[start:end, None] > et))
+            for b, e in zip(*(index.tolist() for index in np.nonzero(overlap))):
+                if hits and hits[-1][0] == start + b:
+                    continue  # This bomb already hit an earlier enemy
+                enemy = int(enemies[e])
+                if enemy in destroyed:
+                    continue
+                bomb = int(bombs[start + b])
+                if hitbox == "mask" and not masks_overlap(self.views[bomb], self.views[enemy]):
+                    continue
+                destroyed.add(enemy)
+                hits.append((start + b, enemy))
+        if not hits:
+            return []
+        pairs = [(self.views[int(bombs[b])], self.views[e]) for b, e in hits]
+        self.kill_rows(np.array([int(bombs[b]) for b, _ in hits] + [e for _, e in hits], dtype=np.intp))
+        return pairs
+
+    def collect(self, kind, target, hitbox="rect"):
+        """Remove and return the entities of `kind` touching `target` (a GameObject)."""
+        rows = self._rows(kind)
+        if len(rows) == 0:
+            return []
+        rect = target.rect
+        left, top, right, bottom = self._edges(rows)
+        touching = rows[(left < rect.right) & (right > rect.left) & (top < rect.bottom) & (bottom > rect.top)]
+        if hitbox == "mask":
+            touching = np.array([row for row in touching.tolist() if masks_overlap(target, self.views[row])],
+                                dtype=np.intp)
+        return self.kill_rows(touching)
+
+    def clear(self):
+        for view in self.views:
+            view.row = -1
+        self.views = []
+        self.count = 0
@@ -0,0 +1,183 @@
+"""Gym-style environments over the headless level simulation, for bots.
+
+SpaceWarshipEnv wraps one seeded Level with the reset()/step() protocol
+used by gymnasium: step() takes an action, advances `frame_skip` fixed
+simulation ticks and returns (observation, reward, terminated, truncated,
+info).  No window, audio or frame cap is involved, so an episode runs as
+fast as the simulation does.
+
+Actions are the replay key masks: bit 0 LEFT, bit 1 RIGHT, bit 2 SPACE
+(0-7).  The observation is a flat vector of floats in roughly [0, 1]:
+
+    player x, lives, ammo,
+    x, y of the MAX_ENEMIES lowest enemies (zeros when absent),
+    x, y of the lowest ammo drop (zeros when absent)
+
+The reward is +1 per enemy destroyed and -1 per life lost.
+
+SpaceWarshipVectorEnv runs N independent environments split across a pool
+of worker processes and steps them in one batch; finished episodes are
+reset automatically, with the final info kept under "final_info".
+"""
+import multiprocessing
+import random
+
+from headless import create_level
+from replay import LEFT, RIGHT, SPACE, ReplayKeys
+from timing import FRAME_DT
+from utils import SCREEN_WIDTH, SCREEN_HEIGHT, np
+
+N_ACTIONS = 8
+MAX_ENEMIES = 5
+OBSERVATION_SIZE = 3 + 2 * MAX_ENEMIES + 2
+SCORE_PER_KILL = 50
+MAX_LIVES = 10
+MAX_AMMO = 20
+_KEYS = [ReplayKeys(mask) for mask in range(N_ACTIONS)]
+
+
+class SpaceWarshipEnv:
+    def __init__(self, level_num=1, seed=None, frame_skip=1, max_ticks=60 * 60 * 5):
+        self.level_num = level_num
+        self.seeds = random.Random(seed)  # Draws one level seed per episode
+        self.frame_skip = frame_skip
+        self.max_ticks = max_ticks
+        self.level = None
+        self.keys = _KEYS[0]
+        self.ticks = 0
+
+    def reset(self, seed=None):
+        """Start a new episode; returns (observation, info)."""
+        if self.level is not None:
+            self.level.close()
+        if seed is not None:
+            self.seeds.seed(seed)
+        self.level = create_level(self.level_num, self.seeds.randrange(2 ** 32))
+        self.level.get_pressed = lambda: self.keys
+        self.keys = _KEYS[0]
+        self.ticks = 0
+        return self.observation(), self.info()
+
+    def step(self, action):
+        """Hold `action`'s keys for frame_skip ticks; returns (obs, reward, terminated, truncated, info)."""
+        level = self.level
+        self.keys = _KEYS[action]
+        score, lives = level.score, level.player.lives
+        for _ in range(self.frame_skip):
+            level.update(FRAME_DT)
+            self.ticks += 1
+            if level.state != "playing":
+                break
+        reward = (level.score - score) / SCORE_PER_KILL - (lives - max(level.player.lives, 0))
+        terminated = level.state in ("won", "lost")
+        truncated = not terminated and self.ticks >= self.max_ticks
+        return self.observation(), reward, terminated, truncated, self.info()
+
+    def observation(self):
+        level = self.level
+        player = level.player
+        obs = [player.rect.centerx / SCREEN_WIDTH, player.lives / MAX_LIVES, min(player.ammo, MAX_AMMO) / MAX_AMMO]
+        enemies = sorted(level.enemies, key=lambda enemy: -enemy.rect.bottom)[:MAX_ENEMIES]
+        for enemy in enemies:
+            obs += [enemy.rect.centerx / SCREEN_WIDTH, enemy.rect.bottom / SCREEN_HEIGHT]
+        obs += [0.0, 0.0] * (MAX_ENEMIES - len(enemies))
+        if level.ammo_drops:
+            drop = max(level.ammo_drops, key=lambda drop: drop.rect.bottom)
+            obs += [drop.rect.centerx / SCREEN_WIDTH, drop.rect.bottom / SCREEN_HEIGHT]
+        else:
+            obs += [0.0, 0.0]
+        return np.asarray(obs, dtype=np.float32) if np is not None else obs
+
+    def info(self):
+        level = self.level
+        return {"score": level.score, "lives": level.player.lives, "ammo": level.player.ammo,
+                "ticks": self.ticks, "state": level.state, "seed": level.seed}
+
+    def close(self):
+        if self.level is not None:
+            self.level.close()
+            self.level = None
+
+
+def autopilot_action(obs):
+    """Chase the lowest enemy and fire when under it; a baseline policy for benchmarks."""
+    player_x, target_x = obs[0], obs[3]
+    if obs[4] == 0.0:
+        return 0
+    action = LEFT if target_x < player_x - 0.01 else RIGHT if target_x > player_x + 0.01 else 0
+    if abs(target_x - player_x) < 0.045:
+        action |= SPACE
+    return action
+
+
+#############################################################################
+
+
+def _worker(connection, level_num, seeds, frame_skip, max_ticks):
+    """Own a slice of the vector env's instances and serve batched commands."""
+    envs = [SpaceWarshipEnv(level_num, seed, frame_skip, max_ticks) for seed in seeds]
+    while True:
+        command, payload = connection.recv()
+        if command == "reset":
+            connection.send([env.reset() for env in envs])
+        elif command == "step":
+            results = []
+            for env, action in zip(envs, payload):
+                obs, reward, terminated, truncated, info = env.step(action)
+                if terminated or truncated:
+                    info = dict(info, final_info=info)
+                    obs, _ = env.reset()
+                results.append((obs, reward, terminated, truncated, info))
+            connection.send(results)
+        elif command == "close":
+            for env in envs:
+                env.close()
+            connection.close()
+            return
+
+
+class SpaceWarshipVectorEnv:
+    """`num_envs` independent SpaceWarshipEnvs stepped in a pool of processes."""
+    def __init__(self, num_envs, level_num=1, seed=0, processes=None, frame_skip=1, max_ticks=60 * 60 * 5):
+        self.num_envs = num_envs
+        processes = min(num_envs, processes or multiprocessing.cpu_count())
+        # Spawned workers start a clean interpreter, so no SDL state is shared with the parent
+        context = multiprocessing.get_context("spawn")
+        self.slices = [list(range(i, num_envs, processes)) for i in range(processes)]
+        self.connections = []
+        self.workers = []
+        for indices in self.slices:
+            parent, child = context.Pipe()
+            worker = context.Process(target=_worker, daemon=True,
+                                     args=(child, level_num, [seed + i for i in indices], frame_skip, max_ticks))
+            worker.start()
+            child.close()
+            self.connections.append(parent)
+            self.workers.append(worker)
+
+    def _gather(self, replies):
+        results = [None] * self.num_envs
+        for indices, reply in zip(self.slices, replies):
+            for index, result in zip(indices, reply):
+                results[index] = result
+        return results
+
+    def reset(self):
+        """Reset every instance; returns (observations, infos) in env order."""
+        for connection in self.connections:
+            connection.send(("reset", None))
+        results = self._gather([connection.recv() for connection in self.connections])
+        return [obs for obs, _ in results], [info for _, info in results]
+
+    def step(self, actions):
+        """Step every instance with its action; returns lists of obs, rewards, terminated, truncated, infos."""
+        for indices, connection in zip(self.slices, self.connections):
+            connection.send(("step", [actions[i] for i in indices]))
+        results = self._gather([connection.recv() for connection in self.connections])
+        return tuple(list(column) for column in zip(*results))
+
+    def close(self):
+        for connection in self.connections:
+            connection.send(("close", None))
+        for worker in self.workers:
+            worker.join()
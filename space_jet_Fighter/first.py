@@ -1,7 +1,12 @@
+import os
 import pygame
 import sys
-from utils import load_photos
+from utils import load_photos, load_sound, play_music
+from assets import AssetLoader, with_loading_screen
+from ui_cache import get_button_surface, get_font, render_text_cached
 from level import LevelPage
+from profiler import FrameProfiler
+from scenes import SceneManager
 
 SCREEN_WIDTH = 900
 SCREEN_HEIGHT = 550
@@ -13,6 +18,11 @@ global_music_on = True
 class Game:
     def __init__(self):
         self.state = None
+        self.scenes = None  # SceneManager that every screen queues its transitions on
+        self.replay_dir = os.environ.get("SPACE_WARSHIP_REPLAY_DIR")  # Record every level played here
+        profile_path = os.environ.get("SPACE_WARSHIP_PROFILE")  # Time every level frame, dump here on exit
+        self.profiler = FrameProfiler(profile_path) if profile_path else None
+        self.assets = AssetLoader()  # Decodes images and sounds off the main thread
     
     def change_state(self, new_state):
         self.state = new_state
@@ -20,37 +30,24 @@ class Game:
 pygame.init()
 pygame.mixer.init()
 
-# Set up the screen and clock
+# Set up the screen
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Space Warship Combat")
-clock = pygame.time.Clock()
 
-# Load background image
-background = load_photos("first", False)
-heading_font = pygame.font.SysFont("Arial", 80, bold=True)
-button_font = pygame.font.SysFont("Arial", 50, bold=True)
+# Everything the main menu needs, plus the sprites every level uses
+STARTUP_ASSETS = [("photo", "first"), ("sound", "button_click"), ("atlas", None)]
+
+heading_font = get_font("Arial", 80, bold=True)
+button_font = get_font("Arial", 50, bold=True)
 
 # Define the buttons for the main page
 start_button = pygame.Rect(SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 - 100, 300, 60)
 settings_button = pygame.Rect(SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2, 300, 60)
 exit_button = pygame.Rect(SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 + 100, 300, 60)
 
-# Load sounds
-try:
-    button_click_sound = pygame.mixer.Sound("assets/sounds/button_click.mp3")
-    background_music = "assets/sounds/background_music.mp3"
-    
-    # Play background music on loop if music is on
-    if global_music_on:
-        pygame.mixer.music.load(background_music)
-        pygame.mixer.music.play(loops=-1, start=0.0)
-except:
-    print("Warning: Sound files not found. Continuing without sound.")
-    global_music_on = False
-
 # Function to render text
 def render_text(text, rect, font, color):
-    text_surface = font.render(text, True, color)
+    text_surface = render_text_cached(font, text, color)
     text_rect = text_surface.get_rect(center=rect.center)
     screen.blit(text_surface, text_rect)
 
@@ -58,40 +55,66 @@ def render_text(text, rect, font, color):
 def lighten_color(color, factor=1.2):
     return tuple(min(int(c * factor), 255) for c in color)
 
-# Function to render a gradient effect on a button
-def render_gradient_button(button_rect, color1, color2):
+# Function to render a gradient button; the finished surface comes from the UI cache
+def render_gradient_button(button_rect, color1, color2, label, hover=False):
     if button_rect.width <= 0 or button_rect.height <= 0:
         return  
-    gradient_surface = pygame.Surface((button_rect.width, button_rect.height), pygame.SRCALPHA)
-    for i in range(button_rect.height):
-        color = [
-            int(color1[j] * (1 - i / button_rect.height) + color2[j] * (i / button_rect.height))
-            for j in range(3)
-        ]
-        pygame.draw.line(gradient_surface, color, (0, i), (button_rect.width, i))
-    screen.blit(gradient_surface, button_rect)
+    button_surface = get_button_surface(button_rect.size, color1, color2, label, button_font, (0, 0, 0), hover)
+    screen.blit(button_surface, button_rect)
 
 # Function to show settings page
-def show_settings_page():
+def show_settings_page(game):
     from game_setting import GameSetting
-    settings_page = GameSetting()
-    settings_page.show_settings()
+    game.scenes.push(lambda: GameSetting(game))
 
-def main():
-    game = Game() 
-    running = True
+class MainMenu:
+    idle = True  # Hover effects are the only animation
 
-    # Define the colors for the buttons and heading
-    color1 = (255, 165, 0)  # Orange
-    color2 = (255, 0, 0)    # Red
-    
-    # Create  colors for buttons
-    start_button_color = lighten_color(color1)
-    settings_button_color = lighten_color(color2)
-    exit_button_color = lighten_color(color1, 1.1)
+    def __init__(self, game):
+        global global_music_on
+        self.game = game
+        # Cache hits: the loading screen in front of the menu decoded these
+        self.background = load_photos("first", False)
+
+        # Load sounds
+        try:
+            self.button_click_sound = load_sound("button_click")
+
+            # Play background music on loop if music is on
+            if global_music_on:
+                play_music("background_music")
+        except:
+            print("Warning: Sound files not found. Continuing without sound.")
+            global_music_on = False
+
+        # Define the colors for the buttons and heading
+        self.color1 = (255, 165, 0)  # Orange
+        self.color2 = (255, 0, 0)    # Red
+
+    def handle_input(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.game.scenes.quit()
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if start_button.collidepoint(event.pos):
+                    if global_music_on:
+                        self.button_click_sound.play()
+                    self.game.scenes.push(lambda: LevelPage(self.game))
+                elif settings_button.collidepoint(event.pos):
+                    if global_music_on:
+                        self.button_click_sound.play()
+                    show_settings_page(self.game)
+                elif exit_button.collidepoint(event.pos):
+                    if global_music_on:
+                        self.button_click_sound.play()
+                    self.game.scenes.quit()
 
-    while running:
-        screen.blit(background, (0, 0))
+    def update(self, dt=None):
+        pass
+
+    def draw(self, screen):
+        color1, color2 = self.color1, self.color2
+        screen.blit(self.background, (0, 0))
 
         # Render heading with larger font size
         render_text("Space Warship Combat", 
@@ -128,37 +151,23 @@ def main():
             exit_button_inflated = exit_button
 
         # Draw gradient buttons
-        render_gradient_button(start_button_inflated, color1, color2)
-        render_text("Start Game", start_button_inflated, button_font, (0, 0, 0))
-
-        render_gradient_button(settings_button_inflated, color2, color1)
-        render_text("Settings", settings_button_inflated, button_font, (0, 0, 0))
+        render_gradient_button(start_button_inflated, color1, color2, "Start Game", start_button_enlarge)
+        render_gradient_button(settings_button_inflated, color2, color1, "Settings", settings_button_enlarge)
+        render_gradient_button(exit_button_inflated, color1, color2, "Exit", exit_button_enlarge)
 
-        render_gradient_button(exit_button_inflated, color1, color2)
-        render_text("Exit", exit_button_inflated, button_font, (0, 0, 0))
+        pygame.display.flip()
 
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if start_button.collidepoint(event.pos):
-                    if global_music_on:
-                        button_click_sound.play()
-                    level_page = LevelPage(game)
-                    level_page.show_level_page()
-                elif settings_button.collidepoint(event.pos):
-                    if global_music_on:
-                        button_click_sound.play()
-                    show_settings_page()
-                elif exit_button.collidepoint(event.pos):
-                    if global_music_on:
-                        button_click_sound.play()
-                    running = False
+def main():
+    game = Game()
 
-        pygame.display.flip()
-        clock.tick(60)
+    # Every screen runs as a scene on one stack, driven by this single loop;
+    # restarting or switching levels swaps scenes instead of nesting loops
+    game.scenes = SceneManager(screen)
+    game.scenes.run(with_loading_screen(game, STARTUP_ASSETS, lambda: MainMenu(game)))
+    game.assets.shutdown()
 
+    if game.profiler is not None:
+        game.profiler.dump()
     pygame.quit()
     sys.exit()
 
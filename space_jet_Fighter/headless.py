@@ -0,0 +1,167 @@
+"""Headless, uncapped simulation of a level.
+
+Runs a level with no window, no audio and no frame cap by driving the
+level's own handle_input/update split with fixed simulation steps.  Spawns
+come from the level's tick-driven scheduler and seeded RNG, so a given
+--seed and input source always play out the same way.  Run it from
+the repository root so the asset paths resolve:
+
+    python space_jet_Fighter/headless.py --level 4 --ticks 216000 --seed 7
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from level_engine import Level, load_level_spec
+from timing import FRAME_DT
+
+LEVELS = [1, 2, 3, 4]
+TICK_MS = 1000 * FRAME_DT  # One fixed simulation step
+
+
+class KeyState:
+    """Stand-in for pygame.key.get_pressed() holding a fixed set of keys."""
+    def __init__(self, keys=()):
+        self.keys = frozenset(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+NO_KEYS = KeyState()
+
+
+class ScriptedInput:
+    """Replays a list of (ticks, keys) segments, looping when it runs out."""
+    def __init__(self, segments):
+        self.frames = []
+        for ticks, keys in segments:
+            self.frames.extend([KeyState(keys)] * ticks)
+        self.index = 0
+
+    def __call__(self, level):
+        if not self.frames:
+            return NO_KEYS
+        keys = self.frames[self.index % len(self.frames)]
+        self.index += 1
+        return keys
+
+
+def bot_input(level):
+    """Simple autopilot: chase the lowest enemy (or an ammo drop) and fire."""
+    player = level.player.rect
+    targets = level.enemies or getattr(level, "ammo_drops", [])
+    if not targets:
+        return NO_KEYS
+
+    target = max(targets, key=lambda obj: obj.rect.bottom)
+    keys = []
+    if target.rect.centerx < player.centerx - 10:
+        keys.append(pygame.K_LEFT)
+    elif target.rect.centerx > player.centerx + 10:
+        keys.append(pygame.K_RIGHT)
+    if level.enemies and abs(target.rect.centerx - player.centerx) < 40:
+        keys.append(pygame.K_SPACE)
+    return KeyState(keys)
+
+
+class HeadlessScenes:
+    """Scene stack stand-in for a level simulated on its own.
+
+    Restart, Next Level, Level Select and quitting all hand the screen to
+    another scene.  Headless there is no other scene, so any of them ends
+    the run; `left_by` records which transition the level asked for.
+    """
+    def __init__(self):
+        self.left_by = None
+
+    def leave(self, action):
+        if self.left_by is None:
+            self.left_by = action
+
+    def push(self, factory):
+        self.leave("push")
+
+    def pop(self):
+        self.leave("pop")
+
+    def switch(self, factory):
+        self.leave("switch")
+
+    def quit(self):
+        self.leave("quit")
+
+
+class HeadlessGame:
+    """The parts of first.Game a level uses, without a window or scene loop."""
+    def __init__(self, replay_dir=None):
+        self.scenes = HeadlessScenes()
+        self.replay_dir = replay_dir  # Record the run here, as SPACE_WARSHIP_REPLAY_DIR does for first.py
+
+
+class HeadlessResult:
+    def __init__(self, ticks, seconds, level):
+        self.ticks = ticks
+        self.seconds = seconds
+        self.ticks_per_second = ticks / seconds if seconds else float("inf")
+        self.simulated_seconds = ticks * TICK_MS / 1000
+        self.state = level.state
+        self.score = level.score
+        self.lives = level.player.lives
+        self.seed = level.seed
+        self.left_by = level.game.scenes.left_by  # Set when the level asked to leave (e.g. Restart)
+
+    def __repr__(self):
+        left = f", left by {self.left_by}" if self.left_by else ""
+        return (f"{self.ticks} ticks ({self.simulated_seconds:.0f}s simulated) in "
+                f"{self.seconds:.2f}s -> {self.ticks_per_second:.0f} ticks/s, "
+                f"state={self.state}, score={self.score}, lives={self.lives}, seed={self.seed}{left}")
+
+
+def create_level(level_num, seed=None, state="playing", entity_store=False, game=None):
+    """Build a silent level ready to simulate; replays start it "waiting" for their first click.
+
+    The level runs inside a HeadlessGame (`game`, or a new one), so scene
+    changes it asks for end the run instead of needing a scene stack.
+    """
+    pygame.init()
+    level = Level(game or HeadlessGame(), load_level_spec(level_num), seed, entity_store=entity_store)
+    pygame.mixer.quit()
+    level.__dict__.pop("ammo_fire_sound", None)
+    level.__dict__.pop("button_click_sound", None)
+    pygame.event.clear()
+    level.state = state
+    return level
+
+
+def run_headless(level_num, max_ticks, input_source=bot_input, seed=None, entity_store=False):
+    """Simulate up to `max_ticks` frames of a level as fast as possible."""
+    level = create_level(level_num, seed, entity_store=entity_store)
+    level.get_pressed = lambda: input_source(level)
+
+    ticks = 0
+    start = time.perf_counter()
+    while ticks < max_ticks and level.state not in ("won", "lost") and not level.game.scenes.left_by:
+        level.handle_input()
+        level.update(FRAME_DT)
+        ticks += 1
+    return HeadlessResult(ticks, time.perf_counter() - start, level)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a level headless and uncapped.")
+    parser.add_argument("--level", type=int, default=1, choices=LEVELS)
+    parser.add_argument("--ticks", type=int, default=60 * 60 * 60, help="frames to simulate (default: one hour)")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed (default: random)")
+    parser.add_argument("--entity-store", action="store_true", help="keep entities in the NumPy entity store")
+    args = parser.parse_args()
+    print(run_headless(args.level, args.ticks, seed=args.seed, entity_store=args.entity_store))
+
+
+if __name__ == "__main__":
+    main()
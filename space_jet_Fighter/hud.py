@@ -0,0 +1,74 @@
+"""The in-game HUD: lives, ammo and score composited onto one surface.
+
+Levels used to blit the heart icon once per life and the bomb icon once
+per round of ammo on every frame, and ammo drops can push ammo up without
+limit.  The Hud renders all three rows onto a single transparent surface
+and keeps it until one of the values actually changes, so a frame costs
+one blit however well stocked the player is.  A row with more than
+ICON_LIMIT icons collapses to one icon and a numeric counter.
+"""
+import pygame
+
+from render_queue import LAYER_HUD
+from ui_cache import get_font, render_text_cached
+
+ICON_LIMIT = 10  # Past this many icons a row shows "icon x N" instead
+HUD_POSITION = (10, 10)
+HEART_SPACING = 40
+AMMO_SPACING = 20
+ROW_GAP = 6
+TEXT_COLOR = (255, 255, 255)
+
+
+class Hud:
+    def __init__(self, heart_image, ammo_image, icon_limit=ICON_LIMIT, position=HUD_POSITION):
+        self.heart_image = heart_image
+        self.ammo_image = ammo_image
+        self.icon_limit = icon_limit
+        self.position = position
+        self.font = get_font("Arial", 24, bold=True)
+        self.values = None
+        self.surface = None
+        self.rebuilds = 0
+
+    def row(self, image, count, spacing):
+        """Return the surface for one row of icons, or an icon with its counter."""
+        if count > self.icon_limit:
+            label = render_text_cached(self.font, f"x {count}", TEXT_COLOR)
+            width = image.get_width() + 8 + label.get_width()
+            height = max(image.get_height(), label.get_height())
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            surface.blit(image, (0, (height - image.get_height()) // 2))
+            surface.blit(label, (image.get_width() + 8, (height - label.get_height()) // 2))
+            return surface
+        width = (count - 1) * spacing + image.get_width() if count > 0 else 0
+        surface = pygame.Surface((width, image.get_height()), pygame.SRCALPHA)
+        for i in range(count):
+            surface.blit(image, (i * spacing, 0))
+        return surface
+
+    def build(self, lives, ammo, score):
+        rows = [
+            self.row(self.heart_image, lives, HEART_SPACING),
+            self.row(self.ammo_image, ammo, AMMO_SPACING),
+            render_text_cached(self.font, f"Score: {score}", TEXT_COLOR),
+        ]
+        surface = pygame.Surface((max(row.get_width() for row in rows),
+                                  sum(row.get_height() for row in rows) + ROW_GAP * (len(rows) - 1)), pygame.SRCALPHA)
+        y = 0
+        for row in rows:
+            surface.blit(row, (0, y))
+            y += row.get_height() + ROW_GAP
+        return surface
+
+    def update(self, lives, ammo, score):
+        """Return the HUD surface, rebuilding it only if a value changed."""
+        values = (max(lives, 0), max(ammo, 0), score)
+        if values != self.values:
+            self.values = values
+            self.surface = self.build(*values)
+            self.rebuilds += 1
+        return self.surface
+
+    def draw(self, renderer, lives, ammo, score):
+        renderer.submit(self.update(lives, ammo, score), self.position, LAYER_HUD)
@@ -1,33 +1,31 @@
 import pygame
-import sys
-from utils import load_photos
+from utils import init_pygame, load_photos, play_music
+from ui_cache import get_font, render_text_cached, text_size
 
 # Initialize constants
 SCREEN_WIDTH = 900
 SCREEN_HEIGHT = 550
 
 class Level5:
+    idle = True  # Static placeholder page
+
     def __init__(self, game=None):
-        pygame.init()
-        pygame.mixer.init()
+        init_pygame()
         
         self.game = game
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
         pygame.display.set_caption("Level 5")
         
         # Load background
         self.background = load_photos("space_background", False)
         
         # Initialize fonts
-        self.font = pygame.font.SysFont("Arial", 60, bold=True)
-        self.button_font = pygame.font.SysFont("Arial", 40, bold=True)
+        self.font = get_font("Arial", 60, bold=True)
+        self.button_font = get_font("Arial", 40, bold=True)
         
         # Sounds
         try:
-            self.background_music = "assets/sounds/background_music.mp3"
-            pygame.mixer.music.load(self.background_music)
-            pygame.mixer.music.play(loops=-1, start=0.0)
+            play_music("background_music")
         except:
             print("Warning: Sound files not found. Continuing without sound.")
 
@@ -40,14 +38,14 @@ class Level5:
 
     def render_text(self, text, x, y, color=(255, 255, 255)):
         """Render text centered at the given position."""
-        text_surface = self.font.render(text, True, color)
+        text_surface = render_text_cached(self.font, text, color)
         self.screen.blit(text_surface, (x, y))
 
     def draw_button(self, rect, text, hover=False):
         """Draw a button with text."""
         color = (70, 70, 70) if hover else (50, 50, 50)
         pygame.draw.rect(self.screen, color, rect, border_radius=10)
-        text_surface = self.button_font.render(text, True, (255, 255, 255))
+        text_surface = render_text_cached(self.button_font, text, (255, 255, 255))
         text_rect = text_surface.get_rect(center=rect.center)
         self.screen.blit(text_surface, text_rect)
 
@@ -55,16 +53,12 @@ class Level5:
         """Handle user input events."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                self.game.scenes.quit()
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if self.back_button_rect.collidepoint(event.pos):
-                    from level import LevelPage
-                    level_page = LevelPage(self.game)
-                    level_page.show_level_page()
-                
+                    self.game.scenes.pop()  # Back to the level select page under us
 
-    def update(self):
+    def update(self, dt=None):
         """Update game state. (Placeholder for future use)"""
         pass
 
@@ -74,17 +68,9 @@ class Level5:
         screen.blit(self.background, (0, 0))
         
         # Render "Coming soon..."
-        self.render_text("Coming soon...", SCREEN_WIDTH // 2 - self.font.size("Coming soon...")[0] // 2, SCREEN_HEIGHT // 2)
+        self.render_text("Coming soon...", SCREEN_WIDTH // 2 - text_size(self.font, "Coming soon...")[0] // 2, SCREEN_HEIGHT // 2)
         
         # Draw buttons with hover effect
         mouse_pos = pygame.mouse.get_pos()
         self.draw_button(self.back_button_rect, "Back", hover=self.back_button_rect.collidepoint(mouse_pos))
-
-    def run(self):
-        """Main game loop for Level 5."""
-        while True:
-            self.handle_input()
-            self.update()
-            self.draw(self.screen)
-            pygame.display.flip()
-            self.clock.tick(60)
+        pygame.display.flip()
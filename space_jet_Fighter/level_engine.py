@@ -0,0 +1,487 @@
+import json
+import math
+import os
+import random
+import pygame
+from utils import get_random_position, init_pygame, load_photos, load_background, load_sound, play_music
+from assets import with_loading_screen
+from collision import resolve_bomb_hits, collect_ammo_drops, without
+from entity_store import EntityStore, KIND_AMMO_DROP, KIND_BOMB, KIND_ENEMY
+from hud import Hud
+from profiler import NULL_PROFILER
+from renderer import Renderer
+from replay import ReplayRecorder
+from spawner import SpawnScheduler
+from timing import FRAME_DT
+from ui_cache import get_font, get_gradient_surface, render_text_cached, text_size
+from models import PlayerPlane, Bomb, PLANE_SPEED, ammo_drop_pool, bomb_pool, enemy_pool
+
+# Initialize constants
+SCREEN_WIDTH = 900
+SCREEN_HEIGHT = 550
+LEVEL_SPEC_PATH = "./assets/levels/level_{}.json"
+RESUME_COUNTDOWN_MS = 3000  # "Resuming in 3..." before play picks up again
+
+# Button colors: flat buttons use the first color, gradient buttons blend both
+PAUSE_BUTTON_COLORS = ((25, 25, 112), (0, 0, 255))
+MENU_BUTTON_COLORS = ((255, 223, 0), (255, 165, 0))
+
+
+_spec_cache = {}
+
+
+def load_level_spec(level_num):
+    """Load the declarative spec for a level, or None if there isn't one.
+
+    Specs are read once and shared by every Level built from them, so
+    treat the returned dict as read-only.
+    """
+    if level_num in _spec_cache:
+        return _spec_cache[level_num]
+    path = LEVEL_SPEC_PATH.format(level_num)
+    if not os.path.exists(path):
+        return None
+    with open(path) as spec_file:
+        spec = json.load(spec_file)
+    spec["number"] = level_num
+    _spec_cache[level_num] = spec
+    return spec
+
+
+def level_assets(level_num):
+    """The (kind, name) assets a level needs, for AssetLoader.preload/prefetch."""
+    assets = [("atlas", None), ("sound", "button_click"), ("sound", "ammo_fire")]
+    spec = load_level_spec(level_num)
+    if spec is not None:
+        assets.append(("background", spec["background"]))
+    elif level_num == 5:
+        assets.append(("photo", "space_background"))
+    return assets
+
+
+def create_level(level_num, game=None):
+    """Build the level for `level_num`: a spec-driven Level, or Level5's placeholder."""
+    spec = load_level_spec(level_num)
+    if spec is not None:
+        return Level(game, spec)
+    if level_num == 5:
+        from level5 import Level5
+        return Level5(game)
+    return None
+
+
+class Level:
+    """One gameplay level, configured entirely by a spec from assets/levels.
+
+    A spec sets the background, starting lives and ammo, enemy speed and
+    spawn rate, how many enemies to beat (null for endless), optional ammo
+    drops and speed escalation, and the look of the buttons and game-over
+    screen.  See assets/levels/level_*.json.
+
+    Spawns run on a SpawnScheduler advanced by update(dt) and enemy/ammo-drop
+    positions come from an RNG seeded with `seed` (random when not given),
+    so the same seed and inputs replay the same game.
+
+    With `entity_store` set, enemies, bombs and ammo drops live in a NumPy
+    EntityStore (see entity_store) and move, cull and collide as arrays;
+    the level lists then hold its views instead of pooled GameObjects.
+    """
+    def __init__(self, game=None, spec=None, seed=None, entity_store=False):
+        init_pygame()
+
+        self.game = game
+        self.spec = spec
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        Bomb.LEFTRIGHT = 1  # Bombs alternate wings through a class counter; start every run on the same one
+        self.spawner = SpawnScheduler(FRAME_DT)
+        self.store = EntityStore() if entity_store else None
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.alpha = 1.0  # Interpolation factor between the last two simulation steps
+        pygame.display.set_caption(spec["name"])
+
+        # Load background and images
+        self.background = load_background(spec["background"])
+        self.heart_image = load_photos("lives")
+        self.ammo_image = load_photos("bomb")
+        self.hud = Hud(self.heart_image, self.ammo_image)
+        self.renderer = Renderer(self.screen, self.background)
+
+        # Initialize fonts
+        self.font = get_font("Arial", 30, bold=True)
+
+        # Player setup
+        self.player = PlayerPlane(self.create_bomb)
+        self.player.lives = spec["lives"]
+        self.player.ammo = spec["ammo"]
+        self.player.bombs = []  # Initialize bombs list for the player
+        self.get_pressed = pygame.key.get_pressed  # Swapped for scripted input when headless
+        self.player.speed = spec.get("player_speed", PLANE_SPEED)
+
+        # Enemy setup; a null enemy count means the level never ends
+        self.enemies = []
+        self.enemy_speed = spec["enemy_speed"]
+        self.enemies_remaining = spec["enemies"]
+        self.enemies_spawned = 0
+        self.escalation = spec.get("escalation")
+        self.enemy_spawn_delay = spec["enemy_spawn_delay"]
+        self.spawner.every("enemy", self.enemy_spawn_delay)
+
+        # Ammo drop setup
+        self.ammo_drops = []
+        if spec.get("ammo_drops"):
+            self.ammo_drop_spawn_delay = spec["ammo_drops"]["spawn_delay"]
+            self.ammo_drop_amount = spec["ammo_drops"]["ammo"]
+            self.spawner.every("ammo_drop", self.ammo_drop_spawn_delay)
+
+        # Game state
+        self.score = 0
+        self.state = "waiting"
+        self.resume_countdown_ms = 0
+        self.game_over_buttons = {}
+
+        # In-game buttons; draw() paints them, but clicks work even on frames never drawn (headless replays)
+        self.pause_button = pygame.Rect(SCREEN_WIDTH - 150, 10, 120, 40)
+        self.resume_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2, 200, 50)
+        self.restart_button = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 70, 200, 50)
+
+        # Frame profiler shared through the game when profiling is on
+        self.profiler = getattr(game, "profiler", None) or NULL_PROFILER
+
+        # Input recording, when the game was started with a replay directory
+        self.recorder = None
+        if game is not None and getattr(game, "replay_dir", None):
+            self.recorder = ReplayRecorder.create(game.replay_dir, spec["number"], self.seed)
+
+        # Sounds
+        try:
+            self.button_click_sound = load_sound("button_click")
+            self.ammo_fire_sound = load_sound("ammo_fire")
+            play_music("background_music")  # Keeps playing across levels instead of restarting
+        except:
+            print("Warning: Sound files not found. Continuing without sound.")
+
+    @property
+    def idle(self):
+        """Nothing moves outside of play, so the scene loop can sleep until input."""
+        return self.state not in ("playing", "resuming")
+
+    def create_bomb(self, bomb):
+        """Create a new bomb and add it to the player's bomb list."""
+        if self.store is not None:
+            # The player fires pooled Bombs; move the shot into the store and recycle the Bomb at once
+            bomb_pool.release(bomb)
+            bomb = self.store.spawn(KIND_BOMB, bomb.sprite, bomb.rect.topleft, -bomb.speed)
+        self.player.bombs.append(bomb)
+        if hasattr(self, 'ammo_fire_sound'):
+            self.ammo_fire_sound.play()
+
+    def render_text(self, text, x, y, color=(0, 0, 0)):
+        """Render text centered at the given position."""
+        text_surface = render_text_cached(self.font, text, color)
+        return self.screen.blit(text_surface, (x, y))
+
+    def draw_gradient(self, rect, color1, color2):
+        """Draw a gradient-filled rectangle from the shared UI cache."""
+        self.screen.blit(get_gradient_surface(rect.size, color1, color2), rect)
+
+    def draw_button(self, rect, colors):
+        """Draw a button background in the spec's button style."""
+        if self.spec["button_style"] == "gradient":
+            self.draw_gradient(rect, *colors)
+        else:
+            pygame.draw.rect(self.screen, colors[0], rect)
+        return rect
+
+    def spawn_enemy(self):
+        if self.store is not None:
+            new_enemy = self.store.spawn(KIND_ENEMY, load_photos("enemy_plane"), get_random_position(self.rng),
+                                         self.enemy_speed)
+        else:
+            new_enemy = enemy_pool.acquire(self.rng)
+            new_enemy.speed = self.enemy_speed
+            new_enemy.rect.top = 0
+        self.enemies.append(new_enemy)
+        self.enemies_spawned += 1
+        if self.enemies_remaining is not None:
+            self.enemies_remaining -= 1
+
+        # Escalation: speed up after every N spawned enemies
+        if self.escalation and self.enemies_spawned % self.escalation["every"] == 0:
+            self.enemy_speed += self.escalation["enemy_speed_increment"]
+            self.player.speed += self.escalation["player_speed_increment"]
+
+    def spawn_ammo_drop(self):
+        if self.store is not None:
+            new_ammo_drop = self.store.spawn(KIND_AMMO_DROP, load_photos("ammo_drop"), get_random_position(self.rng), 2)
+        else:
+            new_ammo_drop = ammo_drop_pool.acquire(self.rng)
+            new_ammo_drop.rect.top = 0
+        self.ammo_drops.append(new_ammo_drop)
+
+    def release(self, pool, objects):
+        """Return spent entities to their pool; the entity store has already dropped its own."""
+        if self.store is None:
+            pool.release_all(objects)
+
+    def close(self):
+        """Release the level when it leaves the scene stack."""
+        if self.recorder is not None:
+            self.recorder.close()
+
+        # The player calls back into the level to fire; break that cycle so
+        # the level is freed as soon as the scene stack lets go of it
+        self.player.create_bomb_callback = None
+
+        # Hand whatever is still on screen back to the pools for the next level
+        if self.store is not None:
+            self.store.clear()
+        else:
+            enemy_pool.release_all(self.enemies)
+            bomb_pool.release_all(self.player.bombs)
+            ammo_drop_pool.release_all(self.ammo_drops)
+        self.enemies, self.player.bombs, self.ammo_drops = [], [], []
+
+    def restart(self):
+        """Replace this level with a fresh copy of itself."""
+        self.game.scenes.switch(lambda: Level(self.game, self.spec, entity_store=self.store is not None))
+
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.game.scenes.quit()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:  # Left mouse button
+                    mouse_pos = event.pos
+                    if self.recorder is not None:
+                        self.recorder.record_click(mouse_pos)
+                    if self.state == "waiting":
+                        self.state = "playing"
+                    elif self.state == "playing" and self.pause_button.collidepoint(mouse_pos):
+                        self.state = "paused"
+                    elif self.state == "paused":
+                        if self.resume_button.collidepoint(mouse_pos):
+                            self.start_resume_countdown()
+                        elif self.restart_button.collidepoint(mouse_pos):
+                            self.restart()
+                    elif self.state in ("won", "lost"):
+                        self.handle_game_over_click(mouse_pos)
+
+    def handle_input(self):
+        with self.profiler.section("input"):
+            self.handle_events()
+
+    def update(self, dt=FRAME_DT):
+        """Update game state including player, enemies, bombs, and ammo drops movements."""
+        with self.profiler.section("update"):
+            self.step(dt)
+
+    def step(self, dt):
+        """Advance the level by one fixed simulation tick."""
+        # Keys are sampled once per tick so a recording sees exactly what the player did
+        pressed_keys = self.get_pressed()
+        if self.recorder is not None:
+            self.recorder.record_tick(pressed_keys)
+
+        if self.state == "resuming":
+            # The countdown runs on simulation time, so frames keep flowing
+            self.resume_countdown_ms -= dt * 1000
+            if self.resume_countdown_ms <= 0:
+                self.state = "playing"
+                self.renderer.invalidate()  # Wipe the countdown text on the first playing frame
+            return
+        if self.state != "playing":
+            return
+
+        # Spawns that fell due during this dt of simulated time
+        for spawn in self.spawner.advance(dt):
+            if spawn == "enemy" and (self.enemies_remaining is None or self.enemies_remaining > 0):
+                self.spawn_enemy()
+            elif spawn == "ammo_drop":
+                self.spawn_ammo_drop()
+
+        # Move the player, enemies, bombs and ammo drops
+        with self.profiler.section("update.move"):
+            self.player.move(pressed_keys, dt)
+            if self.store is not None:
+                self.store.step(dt)
+            else:
+                for enemy in self.enemies:
+                    enemy.move(dt)
+                for bomb in self.player.bombs:
+                    bomb.move(dt)
+                for ammo_drop in self.ammo_drops:
+                    ammo_drop.move(dt)
+
+        # Return whatever left the screen to its pool; enemies that slip past cost a life
+        with self.profiler.section("update.cull"):
+            if self.store is not None:
+                escaped, spent, missed = self.store.cull_offscreen(SCREEN_HEIGHT)
+            else:
+                escaped = [enemy for enemy in self.enemies if enemy.rect.top > SCREEN_HEIGHT]
+                spent = [bomb for bomb in self.player.bombs if bomb.rect.bottom < 0]
+                missed = [drop for drop in self.ammo_drops if drop.rect.bottom > SCREEN_HEIGHT]
+            if escaped:
+                self.player.lives -= len(escaped)
+                self.enemies = without(self.enemies, escaped)
+                self.release(enemy_pool, escaped)
+            if spent:
+                self.player.bombs = without(self.player.bombs, spent)
+                self.release(bomb_pool, spent)
+            if missed:
+                self.ammo_drops = without(self.ammo_drops, missed)
+                self.release(ammo_drop_pool, missed)
+
+        with self.profiler.section("update.collision"):
+            # Check for collisions with enemies: broad phase, then the sprites' pixel masks
+            if self.store is not None:
+                hits = self.store.bomb_hits(hitbox="mask")
+            else:
+                hits = resolve_bomb_hits(self.player.bombs, self.enemies, hitbox="mask")
+            if hits:
+                self.score += 50 * len(hits)
+
+                # Play the ammo hit sound when an enemy is destroyed
+                if self.spec["hit_sound"] and hasattr(self, 'ammo_fire_sound'):
+                    self.ammo_fire_sound.play()
+
+                hit_bombs = [bomb for bomb, _ in hits]
+                hit_enemies = [enemy for _, enemy in hits]
+                self.player.bombs = without(self.player.bombs, hit_bombs)
+                self.enemies = without(self.enemies, hit_enemies)
+                self.release(bomb_pool, hit_bombs)
+                self.release(enemy_pool, hit_enemies)
+
+            # Handle ammo drop collection
+            if self.store is not None:
+                collected = self.store.collect(KIND_AMMO_DROP, self.player, hitbox="mask")
+            else:
+                collected = collect_ammo_drops(self.ammo_drops, self.player, hitbox="mask")
+            if collected:
+                self.player.ammo += self.ammo_drop_amount * len(collected)
+                self.ammo_drops = without(self.ammo_drops, collected)
+                self.release(ammo_drop_pool, collected)
+
+        # Win/lose condition checks; endless levels can only be lost
+        if self.enemies_remaining == 0 and len(self.enemies) == 0:
+            self.state = "won"
+        elif self.player.lives <= 0:
+            self.state = "lost"
+        if self.state != "playing":
+            # Clear event queue to avoid residual clicks on the game-over buttons
+            pygame.event.clear()
+            # Decode the next level's assets while the game-over screen is up
+            loader = getattr(self.game, "assets", None)
+            if loader is not None and self.spec.get("next_level"):
+                loader.prefetch(level_assets(self.spec["next_level"]))
+
+    def draw(self, screen):
+        """Draw and present one frame, timing both for the profiler."""
+        with self.profiler.section("draw"):
+            self.draw_frame()
+        if self.profiler.overlay:
+            self.renderer.mark(self.profiler.draw_overlay(self.screen))
+        with self.profiler.section("flip"):
+            self.renderer.present()
+        self.profiler.end_frame()
+
+    def draw_frame(self):
+        """Draw the player, enemies, bombs, ammo drops, and UI elements."""
+        # Only live gameplay frames are tracked rect by rect; anything with
+        # text or overlays on top redraws the whole (pre-scaled) background
+        if self.state != "playing":
+            self.renderer.invalidate()
+        self.renderer.begin()
+
+        if self.state == "waiting":
+            name = self.spec["name"]
+            self.render_text(name, SCREEN_WIDTH // 2 - text_size(self.font, name)[0] // 2, 20, (255, 255, 255))
+            self.render_text("Please click to start the game", SCREEN_WIDTH // 2 - text_size(self.font, "Please click to start the game")[0] // 2, SCREEN_HEIGHT // 2, (0, 0, 0))
+        elif self.state in ["playing", "resuming", "won", "lost", "paused"]:
+            # Frozen sprites sit at their latest position instead of between steps
+            alpha = self.alpha if self.state == "playing" else 1.0
+
+            # Queue the player, enemies, bombs and ammo drops; each class has its own layer
+            self.player.draw(self.renderer, alpha)
+            self.renderer.submit_objects(self.enemies, alpha)
+            self.renderer.submit_objects(self.player.bombs, alpha)
+            self.renderer.submit_objects(self.ammo_drops, alpha)
+
+            # Queue the HUD (lives, ammo, score); rebuilt only when one of them changes
+            self.hud.draw(self.renderer, self.player.lives, self.player.ammo, self.score)
+            self.renderer.flush()
+
+            # Draw pause button
+            self.draw_button(self.pause_button, PAUSE_BUTTON_COLORS)
+            self.render_text("Pause", SCREEN_WIDTH - 140 + 60 - text_size(self.font, "Pause")[0] // 2, 15, (0, 0, 0))
+            self.renderer.mark(self.pause_button)
+
+        if self.state == "paused":
+            self.show_pause_menu()
+        elif self.state == "resuming":
+            self.show_resume_countdown()
+        elif self.state == "won" or self.state == "lost":
+            self.show_game_over()
+
+    def show_pause_menu(self):
+        """Display a pause menu with options to resume or restart."""
+        self.draw_button(self.resume_button, MENU_BUTTON_COLORS)
+        self.render_text("Resume", SCREEN_WIDTH // 2 - text_size(self.font, "Resume")[0] // 2, SCREEN_HEIGHT // 2 + 10, (0, 0, 0))
+
+        self.draw_button(self.restart_button, MENU_BUTTON_COLORS)
+        self.render_text("Restart", SCREEN_WIDTH // 2 - text_size(self.font, "Restart")[0] // 2, SCREEN_HEIGHT // 2 + 80, (0, 0, 0))
+
+    def start_resume_countdown(self):
+        """Leave the pause menu; play resumes once the countdown has run out."""
+        self.state = "resuming"
+        self.resume_countdown_ms = RESUME_COUNTDOWN_MS
+
+    def show_resume_countdown(self):
+        """Draw the countdown over the frozen game."""
+        message = f"Resuming in {math.ceil(self.resume_countdown_ms / 1000)}..."
+        self.renderer.mark(self.render_text(message, SCREEN_WIDTH // 2 - text_size(self.font, message)[0] // 2, SCREEN_HEIGHT // 2 - 50, (255, 255, 255)))
+
+    def show_game_over(self):
+        """Draw the game-over screen; its clicks go to handle_game_over_click."""
+        game_over_spec = self.spec["game_over"]
+
+        # Background is pre-scaled to the screen size at load time
+        self.screen.blit(self.background, (0, 0))
+
+        # Update the message based on win/lose state
+        message = game_over_spec["won"] if self.state == "won" else game_over_spec["lost"]
+        self.render_text(message, SCREEN_WIDTH // 2 - text_size(self.font, message)[0] // 2, SCREEN_HEIGHT // 2 - 150, (255, 255, 255))
+
+        # Display final score
+        if game_over_spec["show_score"]:
+            final_score_message = f"Your Score: {self.score}"
+            self.render_text(final_score_message, SCREEN_WIDTH // 2 - text_size(self.font, final_score_message)[0] // 2, SCREEN_HEIGHT // 2 - 100, (255, 255, 255))
+
+        # Define buttons
+        buttons = self.game_over_buttons
+        buttons.clear()
+        buttons["try_again"] = self.draw_button(pygame.Rect(SCREEN_WIDTH // 2 - 300, SCREEN_HEIGHT // 2 + 50, 150, 50), MENU_BUTTON_COLORS)
+        self.render_text("Try Again", SCREEN_WIDTH // 2 - 300 + 75 - text_size(self.font, "Try Again")[0] // 2, SCREEN_HEIGHT // 2 + 65, (0, 0, 0))
+
+        buttons["level_select"] = self.draw_button(pygame.Rect(SCREEN_WIDTH // 2 - 75, SCREEN_HEIGHT // 2 + 50, 150, 50), MENU_BUTTON_COLORS)
+        self.render_text("Level Select", SCREEN_WIDTH // 2 - 75 + 75 - text_size(self.font, "Level Select")[0] // 2, SCREEN_HEIGHT // 2 + 65, (0, 0, 0))
+
+        # Next level button (some levels only offer it after a win)
+        if self.state == "won" or not game_over_spec["next_level_requires_win"]:
+            buttons["next_level"] = self.draw_button(pygame.Rect(SCREEN_WIDTH // 2 + 150, SCREEN_HEIGHT // 2 + 50, 150, 50), MENU_BUTTON_COLORS)
+            self.render_text("Next Level", SCREEN_WIDTH // 2 + 150 + 75 - text_size(self.font, "Next Level")[0] // 2, SCREEN_HEIGHT // 2 + 65, (0, 0, 0))
+
+    def handle_game_over_click(self, mouse_pos):
+        """Queue the scene change for a click on one of the game-over buttons."""
+        buttons = self.game_over_buttons
+        if "try_again" in buttons and buttons["try_again"].collidepoint(mouse_pos):
+            self.restart()
+        elif "level_select" in buttons and buttons["level_select"].collidepoint(mouse_pos):
+            # Levels are pushed on top of the level select page
+            self.game.scenes.pop()
+        elif "next_level" in buttons and buttons["next_level"].collidepoint(mouse_pos):
+            next_level = self.spec["next_level"]
+            self.game.scenes.switch(with_loading_screen(self.game, level_assets(next_level),
+                                                        lambda: create_level(next_level, self.game)))
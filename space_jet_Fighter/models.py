@@ -1,53 +1,99 @@
 # from pygame import Rect, Surface, Vector2
 import pygame
+import random
 from utils import load_photos, get_random_position
+from timing import BASE_FPS, FRAME_DT
+from render_queue import LAYER_PLAYER, LAYER_ENEMIES, LAYER_BOMBS, LAYER_AMMO_DROPS
 
 SCREEN_WIDTH = 900
 SCREEN_HEIGHT = 550
 PLANE_SPEED = 5
+FIRE_COOLDOWN_MS = 250
 
 class GameObject:
+    layer = LAYER_PLAYER  # RenderQueue layer; subclasses draw above or below each other
+
     def __init__(self, position, photos):
         # rectangular sprite
         self.sprite = photos
         self.rect = photos.get_rect(bottomleft = (position[0], position[1]))
-
-    def draw(self, surface):
-        surface.blit(self.sprite, self.rect)
-
-    def move(self):
-        self.rect.move_ip(0, 2)
+        # Position before the last simulation step, for interpolated drawing
+        self.previous_position = None
+        self.remainder = [0.0, 0.0]
+        self.pooled = False  # True while sitting in an ObjectPool's free list
+
+    def reset(self, position):
+        """Return a recycled object to its freshly constructed state at `position`."""
+        self.rect.bottomleft = position
+        self.previous_position = None
+        self.remainder[0] = self.remainder[1] = 0.0
+
+    def draw_position(self, alpha=1.0):
+        if self.previous_position is None or alpha >= 1.0:
+            return self.rect
+        # Draw between the last two simulated positions
+        x0, y0 = self.previous_position
+        x = x0 + (self.rect.x - x0) * alpha
+        y = y0 + (self.rect.y - y0) * alpha
+        return (round(x), round(y))
+
+    def draw(self, renderer, alpha=1.0):
+        """Queue this object on the renderer; it is blitted with its layer on flush."""
+        renderer.submit(self.sprite, self.draw_position(alpha), self.layer)
+
+    def move_by(self, dx, dy):
+        """Move by a fractional amount, carrying the sub-pixel remainder."""
+        self.previous_position = self.rect.topleft
+        self.remainder[0] += dx
+        self.remainder[1] += dy
+        step_x = int(self.remainder[0])
+        step_y = int(self.remainder[1])
+        self.remainder[0] -= step_x
+        self.remainder[1] -= step_y
+        self.rect.move_ip(step_x, step_y)
+
+    def move(self, dt=FRAME_DT):
+        self.move_by(0, 2 * dt * BASE_FPS)
 
 
 #############################################################################
 
 
 class PlayerPlane(GameObject):
-    previous_time = pygame.time.get_ticks()
-    current_time = previous_time
     def __init__(self, create_bomb_callback):
         super().__init__(
             (0, SCREEN_HEIGHT), 
             load_photos("plane_center"))
         self.create_bomb_callback = create_bomb_callback
+        # Fire cooldown runs on simulation time, not the wall clock
+        self.current_time = 0.0
+        self.previous_time = -FIRE_COOLDOWN_MS - 1
+        # Pose sprites are sub-rects of the shared sprite atlas, so banking
+        # every frame is just an attribute assignment.
+        self.sprite_center = load_photos("plane_center")
+        self.sprite_left = load_photos("plane_left")
+        self.sprite_right = load_photos("plane_right")
         self.lives = 3
         self.ammo = 5
+        self.speed = PLANE_SPEED  # Levels override this from their spec
         
 
-    def move(self, pressed_keys):
-        self.sprite = load_photos("plane_center")
+    def move(self, pressed_keys, dt=FRAME_DT):
+        self.sprite = self.sprite_center
+        self.current_time += dt * 1000
        
         if pressed_keys[pygame.K_LEFT]:
-            self.sprite = load_photos("plane_left")
-            self.rect.move_ip(-PLANE_SPEED, 0)
+            self.sprite = self.sprite_left
+            self.move_by(-self.speed * dt * BASE_FPS, 0)
         elif pressed_keys[pygame.K_RIGHT]:
-            self.sprite = load_photos("plane_right")
-            self.rect.move_ip(PLANE_SPEED, 0)
+            self.sprite = self.sprite_right
+            self.move_by(self.speed * dt * BASE_FPS, 0)
+        else:
+            self.previous_position = self.rect.topleft
 
         if pressed_keys[pygame.K_SPACE]:
-            PlayerPlane.current_time = pygame.time.get_ticks()
-            if PlayerPlane.current_time - PlayerPlane.previous_time > 250 and self.ammo > 0:
-                PlayerPlane.previous_time = PlayerPlane.current_time
+            if self.current_time - self.previous_time > FIRE_COOLDOWN_MS and self.ammo > 0:
+                self.previous_time = self.current_time
                 self.shoot()
                 self.ammo -= 1
             
@@ -58,7 +104,7 @@ class PlayerPlane(GameObject):
     
 
     def shoot(self):
-        new_bomb = Bomb(self)
+        new_bomb = bomb_pool.acquire(self)
         self.create_bomb_callback(new_bomb)
         # self.bomb_sound.play()
 
@@ -67,13 +113,18 @@ class PlayerPlane(GameObject):
 
 
 class EnemyPlane(GameObject):
-    def __init__(self):
-        super().__init__(get_random_position(), load_photos("enemy_plane"))
+    layer = LAYER_ENEMIES
+
+    def __init__(self, rng=random):
+        super().__init__(get_random_position(rng), load_photos("enemy_plane"))
+        self.speed = 2
+
+    def reset(self, rng=random):
+        super().reset(get_random_position(rng))
         self.speed = 2
-    
 
-    def move(self):
-        self.rect.move_ip(0, self.speed)
+    def move(self, dt=FRAME_DT):
+        self.move_by(0, self.speed * dt * BASE_FPS)
 
 
 #############################################################################
@@ -81,27 +132,92 @@ class EnemyPlane(GameObject):
 
 class Bomb(GameObject):
     LEFTRIGHT = 1
+    layer = LAYER_BOMBS
+
     def __init__(self, plane):
-        xy = [(35,76), (98,74)][self.LEFTRIGHT]
+        super().__init__(self.launch_position(plane), load_photos("bomb"))
+        self.speed = 5
+
+    @classmethod
+    def launch_position(cls, plane):
+        """Bombs leave from the left and right wing in turn."""
+        xy = [(35,76), (98,74)][cls.LEFTRIGHT]
         Bomb.LEFTRIGHT = (Bomb.LEFTRIGHT + 1) % 2
+        return (plane.rect.topleft[0] + xy[0], plane.rect.topleft[1] + xy[1])
 
-        super().__init__(
-            (plane.rect.topleft[0] + xy[0], plane.rect.topleft[1] + xy[1]), 
-            load_photos("bomb")
-        )
+    def reset(self, plane):
+        super().reset(self.launch_position(plane))
         self.speed = 5
 
 
-    def move(self):
-        self.rect.move_ip(0, -self.speed)
+    def move(self, dt=FRAME_DT):
+        self.move_by(0, -self.speed * dt * BASE_FPS)
 
 
 #############################################################################
 
 
 class AmmoDrop(GameObject):
-    def __init__(self):
-        super().__init__(get_random_position(), load_photos("ammo_drop"))
+    layer = LAYER_AMMO_DROPS
+
+    def __init__(self, rng=random):
+        super().__init__(get_random_position(rng), load_photos("ammo_drop"))
+
+    def reset(self, rng=random):
+        super().reset(get_random_position(rng))
         
 #################################################################################
 
+
+class ObjectPool:
+    """Free list of spent objects of one class.
+
+    acquire() hands back a released object after calling its reset() with
+    the same arguments the constructor takes, and only builds a new one
+    when the free list is empty.  Once a level has been running for a
+    while every shot and spawn is served from the free list, so play no
+    longer allocates entities, Rects or remainder lists.  Callers must
+    drop every reference to an object they release.
+    """
+    def __init__(self, cls):
+        self.cls = cls
+        self.free = []
+        self.stats = {"created": 0, "reused": 0, "released": 0}
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.pooled = False
+            obj.reset(*args)
+            self.stats["reused"] += 1
+            return obj
+        self.stats["created"] += 1
+        return self.cls(*args)
+
+    def release(self, obj):
+        if obj.pooled:
+            return  # already back in the free list
+        obj.pooled = True
+        self.free.append(obj)
+        self.stats["released"] += 1
+
+    def release_all(self, objects):
+        for obj in objects:
+            self.release(obj)
+
+    def clear(self):
+        self.free.clear()
+        for key in self.stats:
+            self.stats[key] = 0
+
+
+bomb_pool = ObjectPool(Bomb)
+enemy_pool = ObjectPool(EnemyPlane)
+ammo_drop_pool = ObjectPool(AmmoDrop)
+
+
+def pool_stats():
+    """Created/reused/released counts and free-list size for each entity pool."""
+    return {pool.cls.__name__: dict(pool.stats, free=len(pool.free))
+            for pool in (bomb_pool, enemy_pool, ammo_drop_pool)}
+
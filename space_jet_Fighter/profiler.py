@@ -0,0 +1,137 @@
+"""Optional per-phase frame profiler for the levels.
+
+Each level times its frame in sections: "input", "update" (with the
+"update.move", "update.cull" and "update.collision" sub-phases), "draw"
+and "flip".  Times from one frame are summed (update may run several
+fixed steps per frame) and kept in a rolling window of the last
+ROLLING_FRAMES frames, from which p50/p95/p99 are read.
+
+Start the game with SPACE_WARSHIP_PROFILE=profile.json (or .csv) to turn
+it on; F3 toggles the overlay and the window is written to that file on
+exit.  When profiling is off, levels get NULL_PROFILER, whose sections
+cost one attribute lookup and an empty with-block.
+"""
+import contextlib
+import csv
+import json
+import time
+from collections import deque
+
+import pygame
+
+from ui_cache import get_font
+
+ROLLING_FRAMES = 600  # Ten seconds at 60 FPS
+OVERLAY_REFRESH_FRAMES = 30  # Re-render the overlay text twice a second
+PERCENTILES = (50, 95, 99)
+TOP_LEVEL_SECTIONS = ("input", "update", "draw", "flip")
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    def __init__(self, dump_path=None, window=ROLLING_FRAMES):
+        self.dump_path = dump_path
+        self.window = window
+        self.samples = deque(maxlen=window)  # One {section: ms} dict per frame
+        self.sections = set()
+        self.current = {}  # section -> milliseconds so far this frame
+        self.frames = 0
+        self.overlay = False
+        self.overlay_surface = None
+
+    @contextlib.contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.current[name] = self.current.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def end_frame(self):
+        """Close the frame: push its section totals into the rolling window."""
+        current = self.current
+        current["frame"] = sum(current.get(name, 0.0) for name in TOP_LEVEL_SECTIONS)
+        self.sections.update(current)
+        self.samples.append(current)
+        self.current = {}
+        self.frames += 1
+        if self.overlay and self.frames % OVERLAY_REFRESH_FRAMES == 0:
+            self.overlay_surface = None
+
+    def stats(self):
+        """{section: {"p50": ms, "p95": ms, "p99": ms, "mean": ms, "max": ms}} over the window."""
+        summary = {}
+        for name in self.sections:
+            values = sorted(sample.get(name, 0.0) for sample in self.samples)
+            row = {f"p{p}": percentile(values, p) for p in PERCENTILES}
+            row["mean"] = sum(values) / len(values)
+            row["max"] = values[-1]
+            summary[name] = row
+        return summary
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        self.overlay_surface = None
+
+    def draw_overlay(self, screen):
+        """Blit the stats table in the bottom-left corner and return its rect."""
+        if self.overlay_surface is None:
+            font = get_font("Consolas", 16)
+            lines = ["section        p50    p95    p99  (ms)"]
+            for name, row in sorted(self.stats().items()):
+                lines.append(f"{name:<13}{row['p50']:6.2f} {row['p95']:6.2f} {row['p99']:6.2f}")
+            line_height = font.get_linesize()
+            surface = pygame.Surface((300, line_height * len(lines) + 8))
+            surface.set_alpha(200)
+            for i, line in enumerate(lines):
+                surface.blit(font.render(line, True, (0, 255, 0)), (4, 4 + i * line_height))
+            self.overlay_surface = surface
+        rect = self.overlay_surface.get_rect(bottomleft=(0, screen.get_height()))
+        screen.blit(self.overlay_surface, rect)
+        return rect
+
+    def dump(self, path=None):
+        """Write the window to `path`: per-frame rows as CSV, or summary plus frames as JSON."""
+        path = path or self.dump_path
+        if not path:
+            return
+        names = sorted(self.sections)
+        rows = [{name: sample.get(name, 0.0) for name in names} for sample in self.samples]
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as out:
+                writer = csv.DictWriter(out, fieldnames=names)
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(path, "w") as out:
+                json.dump({"frames": self.frames, "window": self.window, "stats": self.stats(), "samples": rows}, out, indent=2)
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off."""
+    overlay = False
+
+    def __init__(self):
+        self._section = contextlib.nullcontext()
+
+    def section(self, name):
+        return self._section
+
+    def end_frame(self):
+        pass
+
+    def toggle_overlay(self):
+        pass
+
+    def dump(self, path=None):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
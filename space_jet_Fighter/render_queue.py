@@ -0,0 +1,56 @@
+"""Per-frame sprite batching.
+
+Drawing every enemy, bomb and ammo drop with its own Surface.blit costs a
+Python-to-C round trip per sprite.  A RenderQueue collects the frame's
+(surface, destination) pairs instead, grouped by layer, and flush() hands
+each layer to the target in a single Surface.blits call, lowest layer
+first.  Within a layer sprites keep their submission order.
+
+When the caller does not need the drawn rects back (no dirty-rect
+tracking), flush() uses Surface.fblits where pygame provides it.
+"""
+from collections import defaultdict
+
+# Draw order of the gameplay layers, back to front
+LAYER_PLAYER = 0
+LAYER_ENEMIES = 1
+LAYER_BOMBS = 2
+LAYER_AMMO_DROPS = 3
+LAYER_HUD = 4
+
+
+class RenderQueue:
+    def __init__(self):
+        self.layers = defaultdict(list)  # layer -> [(surface, dest), ...]
+
+    def __len__(self):
+        return sum(len(batch) for batch in self.layers.values())
+
+    def submit(self, surface, dest, layer=0):
+        self.layers[layer].append((surface, dest))
+
+    def submit_objects(self, objects, alpha=1.0):
+        """Queue every GameObject in `objects` on its own layer at its interpolated position."""
+        layers = self.layers
+        for obj in objects:
+            layers[obj.layer].append((obj.sprite, obj.draw_position(alpha)))
+
+    def flush(self, target, track_rects=True):
+        """Blit every queued sprite onto `target`, one call per layer; returns the drawn rects."""
+        rects = []
+        fblits = None if track_rects else getattr(target, "fblits", None)
+        for layer in sorted(self.layers):
+            batch = self.layers[layer]
+            if not batch:
+                continue
+            if track_rects:
+                rects.extend(target.blits(batch))
+            elif fblits is not None:
+                fblits(batch)
+            else:
+                target.blits(batch, doreturn=False)
+            batch.clear()
+        return rects
+
+    def clear(self):
+        self.layers.clear()
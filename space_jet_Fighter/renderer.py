@@ -0,0 +1,76 @@
+"""Frame presentation for gameplay screens.
+
+In dirty-rect mode the renderer remembers every rect drawn last frame,
+restores only those regions from the background, and pushes just the old
+and new rects to the display with a single display.update call.  Any frame
+that cannot be tracked that way (menus, overlays, the first frame) calls
+invalidate() and falls back to a full background blit and display.flip.
+Whatever such a frame drew is unknown to the renderer, so the frame after
+it is redrawn in full as well, which wipes it from the screen.
+
+Sprites are submitted to a RenderQueue and drawn in per-layer batches by
+flush(); anything blitted directly lands on top of what was flushed.
+"""
+import pygame
+
+from render_queue import RenderQueue
+
+DIRTY_RECTS = True  # Set to False to compare against the full-flip path
+
+
+class Renderer:
+    def __init__(self, screen, background, dirty_rects=None):
+        self.screen = screen
+        self.background = background
+        self.dirty_rects = DIRTY_RECTS if dirty_rects is None else dirty_rects
+        self.previous = []
+        self.current = []
+        self.full_redraw = True
+        self.untracked = False  # This frame drew things that were never mark()ed
+        self.queue = RenderQueue()
+
+    def invalidate(self):
+        """Redraw and present the whole screen this frame and the next."""
+        self.full_redraw = True
+        self.untracked = True
+
+    def begin(self):
+        """Clear last frame's sprites by restoring the background under them."""
+        if self.full_redraw or not self.dirty_rects:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous:
+                self.screen.blit(self.background, rect, rect)
+
+    def blit(self, surface, dest, area=None):
+        """Blit onto the screen and track the touched rect for this frame."""
+        rect = self.screen.blit(surface, dest, area)
+        self.current.append(rect)
+        return rect
+
+    def submit(self, surface, dest, layer=0):
+        """Queue a sprite for the next flush()."""
+        self.queue.submit(surface, dest, layer)
+
+    def submit_objects(self, objects, alpha=1.0):
+        self.queue.submit_objects(objects, alpha)
+
+    def flush(self):
+        """Draw the queued sprites, tracking their rects when dirty-rect updates need them."""
+        self.current.extend(self.queue.flush(self.screen, track_rects=self.dirty_rects))
+
+    def mark(self, rect):
+        """Track a rect drawn directly onto the screen (shapes, text)."""
+        self.current.append(pygame.Rect(rect))
+
+    def present(self):
+        """Push the frame to the display with one flip or one update call."""
+        self.flush()
+        if self.full_redraw or not self.dirty_rects:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.previous + self.current)
+        self.previous = self.current
+        self.current = []
+        self.full_redraw = self.untracked
+        self.untracked = False
@@ -0,0 +1,199 @@
+"""Compact input recordings of a level, and headless playback.
+
+A recording holds everything a seeded Level needs to play out the same
+way again: the level number, its RNG seed, the LEFT/RIGHT/SPACE state
+for every simulation tick and every left click.  Keys are stored as a
+3-bit mask run-length encoded against the previous tick, so a minute of
+holding RIGHT costs three bytes.
+
+File layout (little endian):
+
+    b"SWRP" version:u8 level:u8 seed:u32
+    records...
+    0xFF                         end of recording
+
+    0x00-0x07 run:varint         key mask held for `run` ticks
+    0x80 x:u16 y:u16             left click, delivered before the next tick
+
+Record a real game by setting SPACE_WARSHIP_REPLAY_DIR before starting
+first.py; each level played writes one file there.  Play one back
+headless, as fast as the machine allows, from the repository root:
+
+    python space_jet_Fighter/replay.py replays/level2_1234.swr
+"""
+import argparse
+import os
+import struct
+import time
+
+import pygame
+
+MAGIC = b"SWRP"
+VERSION = 3  # Bumped when a change to the simulation stops old recordings from replaying identically
+HEADER = struct.Struct("<4sBBI")
+CLICK = struct.Struct("<HH")
+CLICK_RECORD = 0x80
+END_RECORD = 0xFF
+
+LEFT, RIGHT, SPACE = 1, 2, 4
+KEY_BITS = ((pygame.K_LEFT, LEFT), (pygame.K_RIGHT, RIGHT), (pygame.K_SPACE, SPACE))
+
+
+def key_mask(pressed_keys):
+    return ((pressed_keys[pygame.K_LEFT] and LEFT) | (pressed_keys[pygame.K_RIGHT] and RIGHT)
+            | (pressed_keys[pygame.K_SPACE] and SPACE))
+
+
+def write_varint(stream, value):
+    while value >= 0x80:
+        stream.write(bytes((value & 0x7F | 0x80,)))
+        value >>= 7
+    stream.write(bytes((value,)))
+
+
+def read_varint(data, offset):
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class ReplayRecorder:
+    """Streams one level's inputs to `stream` as they happen."""
+    def __init__(self, stream, level_num, seed):
+        self.stream = stream
+        self.mask = None
+        self.run = 0
+        self.ticks = 0
+        stream.write(HEADER.pack(MAGIC, VERSION, level_num, seed))
+
+    @classmethod
+    def create(cls, directory, level_num, seed):
+        """Open a new recording file in `directory` for a level run."""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"level{level_num}_{seed}_{time.strftime('%Y%m%d-%H%M%S')}.swr")
+        return cls(open(path, "wb"), level_num, seed)
+
+    def flush_run(self):
+        if self.run:
+            self.stream.write(bytes((self.mask,)))
+            write_varint(self.stream, self.run)
+            self.run = 0
+
+    def record_tick(self, pressed_keys):
+        """Called once per simulation tick with the keys that tick saw."""
+        mask = key_mask(pressed_keys)
+        if mask != self.mask:
+            self.flush_run()
+            self.mask = mask
+        self.run += 1
+        self.ticks += 1
+
+    def record_click(self, pos):
+        self.flush_run()
+        self.stream.write(bytes((CLICK_RECORD,)))
+        self.stream.write(CLICK.pack(*pos))
+
+    def close(self):
+        if self.stream.closed:
+            return
+        self.flush_run()
+        self.stream.write(bytes((END_RECORD,)))
+        self.stream.close()
+
+
+class ReplayKeys:
+    """Stand-in for pygame.key.get_pressed() built from a key mask."""
+    def __init__(self, mask):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        for bound_key, bit in KEY_BITS:
+            if key == bound_key:
+                return bool(self.mask & bit)
+        return False
+
+
+class Replay:
+    def __init__(self, level_num, seed, records):
+        self.level_num = level_num
+        self.seed = seed
+        self.records = records  # ("keys", mask, run) and ("click", (x, y)) in order
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as replay_file:
+            data = replay_file.read()
+        magic, version, level_num, seed = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay")
+
+        records = []
+        offset = HEADER.size
+        while offset < len(data) and data[offset] != END_RECORD:
+            kind = data[offset]
+            offset += 1
+            if kind == CLICK_RECORD:
+                records.append(("click", CLICK.unpack_from(data, offset)))
+                offset += CLICK.size
+            else:
+                run, offset = read_varint(data, offset)
+                records.append(("keys", kind, run))
+        return cls(level_num, seed, records)
+
+    @property
+    def ticks(self):
+        return sum(record[2] for record in self.records if record[0] == "keys")
+
+    def frames(self):
+        """Yield (clicks, keys) for every tick: the clicks to deliver first, then the tick's keys."""
+        clicks = []
+        for record in self.records:
+            if record[0] == "click":
+                clicks.append(record[1])
+                continue
+            keys = ReplayKeys(record[1])
+            for _ in range(record[2]):
+                yield clicks, keys
+                clicks = []
+        if clicks:
+            yield clicks, None
+
+
+def run_replay(path):
+    """Play a recording back headless, uncapped, and return a HeadlessResult."""
+    from headless import HeadlessResult, create_level
+    from timing import FRAME_DT
+
+    replay = Replay.load(path)
+    level = create_level(replay.level_num, replay.seed, state="waiting")
+    keys = ReplayKeys(0)
+    level.get_pressed = lambda: keys
+
+    ticks = 0
+    start = time.perf_counter()
+    for clicks, tick_keys in replay.frames():
+        for pos in clicks:
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+        level.handle_input()
+        if tick_keys is None or level.game.scenes.left_by:
+            break  # End of the recording, or a click that left the level (Restart, Level Select, ...)
+        keys = tick_keys
+        level.update(FRAME_DT)
+        ticks += 1
+    return HeadlessResult(ticks, time.perf_counter() - start, level)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a recorded level back headless.")
+    parser.add_argument("path")
+    args = parser.parse_args()
+    print(run_replay(args.path))
+
+
+if __name__ == "__main__":
+    main()
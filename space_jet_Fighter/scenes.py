@@ -0,0 +1,146 @@
+"""Flat scene stack driven from a single top-level loop.
+
+Every screen (main menu, level select, settings, a level) is a scene with
+handle_input(), update(dt) and draw(screen).  Scenes never start another
+screen's loop themselves; they queue a transition with push/pop/switch on
+the manager, and the manager applies it between frames.  A scene that
+leaves the stack has close() called (when it defines one) and its last
+reference dropped right away, so long sessions neither grow the call stack
+nor keep dead levels alive.
+
+Scenes with nothing animating (menus, pause and game-over screens) set
+`idle`.  The loop then blocks in pygame.event.wait instead of redrawing
+at the frame cap, and only draws again once an event (a click, or mouse
+motion that may change a hover effect) arrives.  Per-scene CPU use is
+recorded in `cpu_stats` and summarised by cpu_usage().
+"""
+import time
+
+import pygame
+
+from timing import FixedTimestep, FRAME_RATE
+
+IDLE_TIMEOUT_MS = 500  # Longest an idle scene blocks before the loop checks in again
+
+
+class SceneManager:
+    def __init__(self, screen):
+        self.screen = screen
+        self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep()
+        self.stack = []
+        self.pending = []
+        self.transitions = 0
+        self.needs_redraw = True
+        self.cpu_stats = {}
+
+    @property
+    def current(self):
+        return self.stack[-1] if self.stack else None
+
+    # Transitions are queued as factories so the outgoing scene is released
+    # before the incoming one is built.
+    def push(self, factory):
+        self.pending.append(("push", factory))
+
+    def pop(self):
+        self.pending.append(("pop", None))
+
+    def switch(self, factory):
+        self.pending.append(("switch", factory))
+
+    def quit(self):
+        self.pending.append(("quit", None))
+
+    def _close(self, scene):
+        close = getattr(scene, "close", None)
+        if close is not None:
+            close()
+
+    def apply_transitions(self):
+        """Run the queued transitions; called once per frame by run()."""
+        while self.pending:
+            action, factory = self.pending.pop(0)
+            if action in ("pop", "switch") and self.stack:
+                self._close(self.stack.pop())
+            elif action == "quit":
+                while self.stack:
+                    self._close(self.stack.pop())
+                self.pending.clear()
+                return
+
+            if factory is not None:
+                scene = factory()
+                if scene is not None:
+                    self.stack.append(scene)
+            self.transitions += 1
+
+            # Coming back to a scene: start its frame timing afresh
+            self.timestep.accumulator = 0.0
+            self.needs_redraw = True
+
+    def scene_name(self, scene):
+        """Key for cpu_stats: the scene class, plus its state when it has one."""
+        state = getattr(scene, "state", None)
+        name = type(scene).__name__
+        return f"{name}/{state}" if state else name
+
+    def record(self, scene, wall_start, cpu_start, drew):
+        """Measurement hook: add one frame's wall and CPU time to the scene's totals."""
+        stats = self.cpu_stats.setdefault(self.scene_name(scene), {"frames": 0, "draws": 0, "cpu_s": 0.0, "wall_s": 0.0})
+        stats["frames"] += 1
+        stats["draws"] += drew
+        stats["cpu_s"] += time.process_time() - cpu_start
+        stats["wall_s"] += time.perf_counter() - wall_start
+
+    def cpu_usage(self):
+        """Percent of one core each scene used while it was on top of the stack."""
+        return {name: 100 * stats["cpu_s"] / stats["wall_s"] if stats["wall_s"] else 0.0
+                for name, stats in self.cpu_stats.items()}
+
+    def step(self):
+        """Run one frame of the current scene."""
+        scene = self.stack[-1]
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        idle = getattr(scene, "idle", False)
+
+        # An idle scene with nothing queued sleeps until something happens.
+        # Whatever is queued (or woke it) is posted back in its original
+        # order, so the scene's own handle_input sees every event. The queue
+        # is drained with get() rather than checked with peek(), which in
+        # pygame 2.6 wipes the attributes of posted events; fresh copies are
+        # posted because pygame also drops them once an event is handed out
+        if idle and not self.needs_redraw:
+            queued = pygame.event.get()
+            if not queued:
+                event = pygame.event.wait(IDLE_TIMEOUT_MS)
+                if event.type == pygame.NOEVENT:
+                    self.clock.tick(FRAME_RATE)
+                    self.record(scene, wall_start, cpu_start, drew=False)
+                    return
+                queued = [event] + pygame.event.get()
+            for event in queued:
+                pygame.event.post(pygame.event.Event(event.type, event.dict))
+
+        scene.handle_input()
+        frame_ms = self.clock.tick(FRAME_RATE)
+        if idle:
+            # Nothing simulates while idle, so don't replay the time spent waiting
+            self.timestep.accumulator = 0.0
+        else:
+            for _ in range(self.timestep.advance(frame_ms)):
+                scene.update(self.timestep.dt)
+        scene.alpha = self.timestep.alpha
+        drew = not self.pending
+        if drew:
+            scene.draw(self.screen)
+            self.needs_redraw = False
+        self.record(scene, wall_start, cpu_start, drew)
+        self.apply_transitions()
+
+    def run(self, factory):
+        """Push the first scene and loop until the stack is empty."""
+        self.push(factory)
+        self.apply_transitions()
+        while self.stack:
+            self.step()
@@ -0,0 +1,60 @@
+"""Spawn scheduling on simulation ticks instead of pygame timers.
+
+pygame.time.set_timer fires on the wall clock: spawns kept coming while
+frames were dropped, leaked into the next screen when a level ended, and
+could not be sped up for headless runs.  A SpawnScheduler belongs to one
+level and only moves when the level's update(dt) advances it by dt, so a
+level simulated at 50x real time spawns 50x as fast, and a level that is
+paused or gone spawns nothing.  Intervals are counted in ticks of
+step_dt; advance() turns any dt into whole ticks and carries the rest.
+
+Due events sit in a heap ordered by (tick, insertion order), so events
+that fall on the same tick always come out in the order they were
+scheduled.  Together with the level's seeded RNG this makes a run fully
+reproducible.
+"""
+import heapq
+import itertools
+
+from timing import FRAME_DT
+
+
+class SpawnScheduler:
+    def __init__(self, step_dt=FRAME_DT):
+        self.step_dt = step_dt
+        self.tick_count = 0
+        self.elapsed = 0.0  # Simulated seconds not yet turned into ticks
+        self.queue = []
+        self.order = itertools.count()
+
+    def ms_to_ticks(self, ms):
+        return max(1, round(ms / 1000 / self.step_dt))
+
+    def every(self, name, interval_ms):
+        """Emit `name` every `interval_ms` of simulated time, starting one interval from now."""
+        interval = self.ms_to_ticks(interval_ms)
+        heapq.heappush(self.queue, (self.tick_count + interval, next(self.order), name, interval))
+
+    def advance(self, dt):
+        """Run as many ticks as `dt` seconds cover and return the names that fell due, in order.
+
+        Time left over from a partial tick carries into the next call, so
+        the schedule follows simulated time whatever step the caller uses.
+        """
+        self.elapsed += dt
+        due = []
+        # The tolerance keeps a float sum of step_dt from landing a hair short of a tick
+        while self.elapsed >= self.step_dt * (1 - 1e-9):
+            self.elapsed -= self.step_dt
+            due.extend(self.tick())
+        return due
+
+    def tick(self):
+        """Advance one simulation step and return the names that fell due, in order."""
+        self.tick_count += 1
+        due = []
+        while self.queue and self.queue[0][0] <= self.tick_count:
+            at, _, name, interval = heapq.heappop(self.queue)
+            due.append(name)
+            heapq.heappush(self.queue, (at + interval, next(self.order), name, interval))
+        return due
@@ -0,0 +1,32 @@
+"""Fixed-timestep clock shared by the level loops.
+
+The simulation always advances in steps of 1 / SIMULATION_HZ seconds, no
+matter how long a rendered frame took.  Frame time is fed into an
+accumulator, as many fixed steps as fit are run, and the leftover fraction
+(`alpha`) is used to interpolate sprite positions when drawing.  Under load
+the game drops render frames instead of slowing down.
+"""
+BASE_FPS = 60  # Speeds in models are tuned in pixels per frame at this rate
+SIMULATION_HZ = 60  # Fixed update rate; 120 gives finer steps on fast machines
+FRAME_RATE = 60  # Render cap passed to clock.tick
+FRAME_DT = 1 / SIMULATION_HZ
+MAX_FRAME_MS = 250  # Longer stalls are clamped so the game can't spiral
+
+
+class FixedTimestep:
+    def __init__(self, hz=SIMULATION_HZ):
+        self.dt = 1 / hz
+        self.step_ms = 1000 / hz
+        self.accumulator = 0.0
+
+    def advance(self, frame_ms):
+        """Add a frame's elapsed time and return how many steps to simulate."""
+        self.accumulator += min(frame_ms, MAX_FRAME_MS)
+        steps = int(self.accumulator // self.step_ms)
+        self.accumulator -= steps * self.step_ms
+        return steps
+
+    @property
+    def alpha(self):
+        """How far between the last two simulated states the frame falls."""
+        return self.accumulator / self.step_ms
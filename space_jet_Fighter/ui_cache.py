@@ -0,0 +1,104 @@
+"""Render-once caches for fonts, text, gradients and buttons.
+
+Gradients used to be rebuilt with one pygame.draw.line per pixel row on
+every frame.  Here each (size, colors) gradient and each
+(size, colors, label, hover) button is rendered once and the finished
+Surface is reused; a hovered button is simply a second cached variant.
+
+Text goes through the same idea: fonts are created once per
+(name, size, bold), and rendered strings and their measured sizes are
+kept in a bounded LRU so static labels cost a single blit per frame.
+"""
+from collections import OrderedDict
+
+import pygame
+
+TEXT_CACHE_SIZE = 256  # Rendered strings kept before the least recent is evicted
+
+_gradient_cache = {}
+_button_cache = {}
+_font_cache = {}
+_text_cache = OrderedDict()
+_text_size_cache = OrderedDict()
+text_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_font(name, size, bold=False):
+    """Return a shared SysFont; building one scans the system font list."""
+    key = (name, size, bold)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold)
+        _font_cache[key] = font
+    return font
+
+
+def render_text_cached(font, text, color, antialias=True):
+    """Return `font.render(text, antialias, color)`, reusing earlier renders."""
+    key = (font, text, tuple(color), antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        text_cache_stats["hits"] += 1
+        _text_cache.move_to_end(key)
+        return surface
+
+    text_cache_stats["misses"] += 1
+    surface = font.render(text, antialias, color)
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surface
+
+
+def text_size(font, text):
+    """Cached `font.size(text)`, used for centering labels."""
+    key = (font, text)
+    size = _text_size_cache.get(key)
+    if size is None:
+        size = font.size(text)
+        _text_size_cache[key] = size
+        if len(_text_size_cache) > TEXT_CACHE_SIZE:
+            _text_size_cache.popitem(last=False)
+    else:
+        _text_size_cache.move_to_end(key)
+    return size
+
+
+def get_gradient_surface(size, color1, color2):
+    """Return a vertical gradient from `color1` (top) to `color2` (bottom)."""
+    key = (tuple(size), tuple(color1), tuple(color2))
+    surface = _gradient_cache.get(key)
+    if surface is None:
+        width, height = key[0]
+        surface = pygame.Surface((max(width, 0), max(height, 0))).convert()
+        for y in range(height):
+            blend_ratio = y / height
+            blended_color = [int(color1[i] * (1 - blend_ratio) + color2[i] * blend_ratio) for i in range(3)]
+            pygame.draw.line(surface, blended_color, (0, y), (width, y))
+        _gradient_cache[key] = surface
+    return surface
+
+
+def get_button_surface(size, color1, color2, label, font, text_color=(0, 0, 0), hover=False):
+    """Return a gradient button with its label already rendered in the middle.
+
+    `hover` is part of the key so the inflated hover variant is cached next
+    to the normal one instead of being regenerated.
+    """
+    key = (tuple(size), tuple(color1), tuple(color2), label, font, tuple(text_color), hover)
+    surface = _button_cache.get(key)
+    if surface is None:
+        surface = get_gradient_surface(size, color1, color2).copy()
+        text_surface = render_text_cached(font, label, text_color)
+        surface.blit(text_surface, text_surface.get_rect(center=surface.get_rect().center))
+        _button_cache[key] = surface
+    return surface
+
+
+def clear_ui_cache():
+    _gradient_cache.clear()
+    _button_cache.clear()
+    _text_cache.clear()
+    _text_size_cache.clear()
+    text_cache_stats["hits"] = 0
+    text_cache_stats["misses"] = 0
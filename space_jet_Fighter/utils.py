@@ -1,32 +1,162 @@
 import pygame
 import random
 
+from atlas import ATLAS_SPRITES, ATLAS_VARIANTS, clear_atlas, get_atlas
+from ui_cache import get_font, render_text_cached
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the batched helpers fall back to Python
+    np = None
+
 SCREEN_WIDTH = 900
 SCREEN_HEIGHT = 550
 PLANE_SPEED = 5
 
+# Process-wide asset registry: every image is decoded and converted once,
+# then the same Surface is handed out to every caller.  Callers must treat
+# the returned Surfaces as read-only since they are shared.  Sprites with
+# alpha also get their collision mask built at load time, kept next to the
+# Surface and looked up by it.  Gameplay sprites are subsurfaces of the
+# shared sprite atlas rather than separate images.
+_photo_cache = {}
+_mask_cache = {}
+photo_cache_stats = {"hits": 0, "misses": 0}
+
 def load_photos(name, with_alpha=True):
+    key = (name, with_alpha)
+    cached = _photo_cache.get(key)
+    if cached is not None:
+        photo_cache_stats["hits"] += 1
+        return cached
+
+    photo_cache_stats["misses"] += 1
+    if with_alpha and (name in ATLAS_SPRITES or name in ATLAS_VARIANTS):
+        loaded_photos = get_atlas()[name]
+        _mask_cache[loaded_photos] = pygame.mask.from_surface(loaded_photos)
+        _photo_cache[key] = loaded_photos
+        return loaded_photos
+
     path = f"./assets/photos/{name}.png"
-    loaded_photos = pygame.image.load(path)
+    return install_photo(name, pygame.image.load(path), with_alpha)
 
+
+def install_photo(name, image, with_alpha=True):
+    """Convert a decoded image for the display and register it as `name`."""
     if with_alpha:
-        return loaded_photos.convert_alpha()
+        loaded_photos = image.convert_alpha()
+        _mask_cache[loaded_photos] = pygame.mask.from_surface(loaded_photos)
     else:
-        return loaded_photos
+        loaded_photos = image.convert()
+
+    _photo_cache[(name, with_alpha)] = loaded_photos
+    return loaded_photos
+
+
+def photo_loaded(name, with_alpha=True):
+    return (name, with_alpha) in _photo_cache
+
+
+def get_mask(surface):
+    """Return the collision mask of a sprite, built once per Surface."""
+    mask = _mask_cache.get(surface)
+    if mask is None:
+        mask = pygame.mask.from_surface(surface)
+        _mask_cache[surface] = mask
+    return mask
+
+
+_background_cache = {}
+
+def load_background(name, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+    """Return an opaque background scaled to `size` in the display format.
+
+    The scale and conversion happen once per (asset, resolution), so levels
+    can blit the result every frame without any per-frame resampling.
+    """
+    key = (name, tuple(size))
+    background = _background_cache.get(key)
+    if background is None:
+        background = pygame.transform.scale(load_photos(name, False), key[1]).convert()
+        _background_cache[key] = background
+    return background
+
+
+def clear_photo_cache():
+    """Drop every cached image and reset the hit/miss counters."""
+    _photo_cache.clear()
+    _mask_cache.clear()
+    clear_atlas()
+    _background_cache.clear()
+    photo_cache_stats["hits"] = 0
+    photo_cache_stats["misses"] = 0
+
+
 #############################################################################
 
 
+_sound_cache = {}
+_music_playing = None
+_music_missing = set()  # Tracks that failed to load; not retried from disk
+
+
 def load_sound(name):
-    path = f"./assets/sounds/{name}.mp3"
-    loaded_sound = pygame.mixer.Sound(path)
+    """Return the decoded sound `name`; MP3 decoding happens once per process."""
+    loaded_sound = _sound_cache.get(name)
+    if loaded_sound is None:
+        path = f"./assets/sounds/{name}.mp3"
+        loaded_sound = pygame.mixer.Sound(path)
+        _sound_cache[name] = loaded_sound
     return loaded_sound
 
 
+def clear_sound_cache():
+    _sound_cache.clear()
+
+
+def install_sound(name, sound):
+    _sound_cache[name] = sound
+
+
+def sound_loaded(name):
+    return name in _sound_cache
+
+
+def init_pygame():
+    """Initialise pygame and its mixer unless they already are.
+
+    Screens call this from their constructors, and scenes are rebuilt on
+    every push, restart and level change.
+    """
+    if not pygame.get_init():
+        pygame.init()
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+
+
+def play_music(name):
+    """Loop the music track `name`, unless it is already the one playing.
+
+    A track that failed to load raises once; later calls do nothing.
+    """
+    global _music_playing
+    if name in _music_missing or (_music_playing == name and pygame.mixer.music.get_busy()):
+        return
+    try:
+        pygame.mixer.music.load(f"./assets/sounds/{name}.mp3")
+    except (pygame.error, OSError):
+        _music_missing.add(name)
+        raise
+    pygame.mixer.music.play(loops=-1, start=0.0)
+    _music_playing = name
+
+
 #############################################################################
 
 
-def get_random_position():
-    return (random.randint(0, SCREEN_WIDTH - 150), 0)
+def get_random_position(rng=random):
+    """Spawn point along the top edge; pass a seeded random.Random to make it reproducible."""
+    return (rng.randint(0, SCREEN_WIDTH - 150), 0)
 
 
 #############################################################################
@@ -55,6 +185,62 @@ def bomb_collides_with_enemy(bomb, enemy):
     return areaCurrent == areaEnemy
 
 
+def bombs_hit_enemy_triangles(bombs, enemies):
+    """Pairwise version of bomb_collides_with_enemy for equal-length lists.
+
+    Tests bombs[i] against enemies[i] for every i in one NumPy call and
+    returns a boolean array (a plain list when numpy is unavailable).
+    """
+    if np is None:
+        return [bomb_collides_with_enemy(bomb, enemy) for bomb, enemy in zip(bombs, enemies)]
+    if not bombs:
+        return np.zeros(0, dtype=bool)
+
+    px = np.fromiter((bomb.rect.centerx for bomb in bombs), dtype=np.int64, count=len(bombs))
+    py = np.fromiter((bomb.rect.centery for bomb in bombs), dtype=np.int64, count=len(bombs))
+    edges = np.array([(e.rect.left, e.rect.top, e.rect.right, e.rect.centerx, e.rect.bottom) for e in enemies],
+                     dtype=np.int64)
+    return _points_in_enemy_triangles(px, py, *edges.T)
+
+
+def bombs_collide_with_enemies(bombs, enemies):
+    """Test every bomb against every enemy's triangle hitbox.
+
+    Returns an N x M boolean matrix (nested lists without numpy).  An AABB
+    pre-filter keeps the triangle test to the pairs whose bomb centre lies
+    inside the enemy rect, which is the triangle's bounding box.
+    """
+    if np is None:
+        return [[bomb_collides_with_enemy(bomb, enemy) for enemy in enemies] for bomb in bombs]
+
+    hits = np.zeros((len(bombs), len(enemies)), dtype=bool)
+    if not bombs or not enemies:
+        return hits
+
+    px = np.array([bomb.rect.centerx for bomb in bombs], dtype=np.int64)[:, None]
+    py = np.array([bomb.rect.centery for bomb in bombs], dtype=np.int64)[:, None]
+    left, top, right, centerx, bottom = (
+        np.array([(e.rect.left, e.rect.top, e.rect.right, e.rect.centerx, e.rect.bottom) for e in enemies],
+                 dtype=np.int64).T[:, None, :])
+
+    inside = (px >= left) & (px <= right) & (py >= top) & (py <= bottom)
+    rows, cols = np.nonzero(inside)
+    hits[rows, cols] = _points_in_enemy_triangles(
+        px[rows, 0], py[rows, 0], left[0, cols], top[0, cols], right[0, cols], centerx[0, cols], bottom[0, cols])
+    return hits
+
+
+def _points_in_enemy_triangles(px, py, left, top, right, centerx, bottom):
+    """Element-wise area test from bomb_collides_with_enemy on integer arrays."""
+    x1, y1, x2, y2, x3, y3 = left, top, right, top, centerx, bottom
+
+    area_enemy = np.abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1))
+    area1 = np.abs((x1 - px) * (y2 - py) - (x2 - px) * (y1 - py))
+    area2 = np.abs((x2 - px) * (y3 - py) - (x3 - px) * (y2 - py))
+    area3 = np.abs((x3 - px) * (y1 - py) - (x1 - px) * (y3 - py))
+    return area1 + area2 + area3 == area_enemy
+
+
 #############################################################################
 
 
@@ -70,8 +256,7 @@ def remove_off_the_screen_height(lst, enemy=False, lives=None):
 
 
 def get_text_surface(text, size):
-    font = pygame.font.SysFont(None, size)
-    surface_with_text = font.render(text, True, (255, 255, 255))
+    surface_with_text = render_text_cached(get_font(None, size), text, (255, 255, 255))
     return surface_with_text
 
     
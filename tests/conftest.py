@@ -0,0 +1,26 @@
+"""Shared test setup: SDL's dummy drivers, the game modules on sys.path and the asset paths.
+
+The game imports its modules by bare name and loads assets relative to
+the repository root, so both are set up here before any test imports them.
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "space_jet_Fighter"))
+os.chdir(ROOT)
+
+import pygame
+import pytest
+
+from utils import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
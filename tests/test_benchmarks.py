@@ -0,0 +1,413 @@
+"""Timings of the game's hot paths, under pytest-benchmark.
+
+Each group pairs the code a change replaced with the code that replaced
+it, so the speedup stays visible in review.  Save a baseline and compare
+against it as described in the README; every timing here is compared,
+none are left out for being noisy.
+"""
+import io
+import random
+import time
+
+import pygame
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from collision import resolve_bomb_hits
+from headless import KeyState, NO_KEYS, create_level, run_headless
+from models import AmmoDrop, Bomb, EnemyPlane, PlayerPlane, ammo_drop_pool, bomb_pool, enemy_pool
+from utils import (SCREEN_WIDTH, SCREEN_HEIGHT, bomb_collides_with_enemy, bombs_collide_with_enemies,
+                   clear_photo_cache, load_background, load_photos, remove_off_the_screen_height)
+
+BUSY_SCREEN_AREA = SCREEN_WIDTH * SCREEN_HEIGHT / 10  # Screen area per enemy on a busy screen
+
+
+class Body:
+    def __init__(self, rect):
+        self.rect = rect
+
+
+def scatter(count, size, rng, area_each=BUSY_SCREEN_AREA):
+    """Place `count` rects at constant density: the field grows with `count`."""
+    side = int((count * area_each) ** 0.5)
+    return [Body(pygame.Rect(rng.randrange(side), rng.randrange(side), *size)) for _ in range(count)]
+
+
+#############################################################################
+
+
+@pytest.mark.benchmark(group="background")
+@pytest.mark.parametrize("name", ["level_2", "level_3", "level_4"])
+@pytest.mark.parametrize("variant", ["scale_every_frame", "prescaled"])
+def test_background(benchmark, screen, name, variant):
+    if variant == "prescaled":
+        background = load_background(name)
+        benchmark(screen.blit, background, (0, 0))
+    else:
+        raw = pygame.image.load(f"./assets/photos/{name}.png")
+        benchmark(lambda: screen.blit(pygame.transform.scale(raw, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0)))
+
+
+@pytest.mark.benchmark(group="load_photos")
+@pytest.mark.parametrize("name", ["enemy_plane", "plane_center", "bomb", "first"])
+@pytest.mark.parametrize("cache", ["cold", "cached"])
+def test_load_photos(benchmark, screen, name, cache):
+    """The first gameplay sprite builds the whole atlas, so its cold time covers every sprite in it."""
+    with_alpha = name != "first"
+    if cache == "cold":
+        benchmark.pedantic(load_photos, (name, with_alpha), setup=clear_photo_cache, rounds=20)
+    else:
+        load_photos(name, with_alpha)
+        benchmark(load_photos, name, with_alpha)
+
+
+@pytest.mark.benchmark(group="player_move")
+def test_player_move(benchmark, screen):
+    player = PlayerPlane(lambda bomb: None)
+    player.ammo = 10 ** 9
+    keys = [KeyState([pygame.K_LEFT, pygame.K_SPACE])] * 30 + [KeyState([pygame.K_RIGHT])] * 30
+    index = iter(range(10 ** 9))
+    benchmark(lambda: player.move(keys[next(index) % len(keys)]))
+
+
+@pytest.mark.benchmark(group="offscreen_cull")
+@pytest.mark.parametrize("count", [10, 100, 1000])
+@pytest.mark.parametrize("variant", ["remove_loop", "comprehension"])
+def test_offscreen_cull(benchmark, screen, count, variant):
+    rng = random.Random(4)
+    enemies = []
+    for _ in range(count):
+        enemy = EnemyPlane(rng)
+        enemy.rect.top = rng.randrange(SCREEN_HEIGHT + 200)
+        enemies.append(enemy)
+    if variant == "remove_loop":
+        benchmark(lambda: remove_off_the_screen_height(enemies[:], True, 3))
+    else:
+        benchmark(lambda: [enemy for enemy in enemies[:] if enemy.rect.top <= SCREEN_HEIGHT])
+
+
+#############################################################################
+
+
+def nested_loop_hits(bombs, enemies):
+    """The collision loop the levels used before the broad phase."""
+    bombs, enemies = bombs[:], enemies[:]
+    hits = 0
+    for bomb in bombs[:]:
+        for enemy in enemies[:]:
+            if bomb.rect.colliderect(enemy.rect):
+                hits += 1
+                bombs.remove(bomb)
+                enemies.remove(enemy)
+                break
+    return hits
+
+
+@pytest.mark.benchmark(group="collisions")
+@pytest.mark.parametrize("count,variant", [(10, "nested"), (100, "nested"), (1000, "nested"),
+                                           (10, "broad_phase"), (100, "broad_phase"), (1000, "broad_phase"),
+                                           (10000, "broad_phase")])
+def test_collisions(benchmark, count, variant):
+    """N bombs against N enemies at the density of a busy screen, so the field grows with N."""
+    rng = random.Random(1)
+    enemies = scatter(count, (137, 175), rng)
+    bombs = scatter(count, (15, 44), rng)
+    benchmark(nested_loop_hits if variant == "nested" else resolve_bomb_hits, bombs, enemies)
+
+
+@pytest.mark.benchmark(group="triangle_hitbox")
+@pytest.mark.parametrize("count", [10, 100, 500])
+@pytest.mark.parametrize("variant", ["scalar", "batched"])
+def test_triangle_hitbox(benchmark, count, variant):
+    rng = random.Random(3)
+    enemies = scatter(count, (137, 175), rng)
+    bombs = scatter(count, (15, 44), rng)
+    if variant == "scalar":
+        benchmark(lambda: [[bomb_collides_with_enemy(bomb, enemy) for enemy in enemies] for bomb in bombs])
+    else:
+        benchmark(bombs_collide_with_enemies, bombs, enemies)
+
+
+@pytest.mark.benchmark(group="mask_hitbox")
+@pytest.mark.parametrize("count", [10, 100, 500])
+@pytest.mark.parametrize("hitbox", ["rect", "triangle", "mask"])
+def test_mask_hitbox(benchmark, screen, count, hitbox):
+    """Hit resolution with real sprites; extra_info["hits"] shows how many overlaps each narrow phase keeps."""
+    rng = random.Random(5)
+    player = PlayerPlane(lambda bomb: None)
+    enemies = [EnemyPlane(rng) for _ in range(count)]
+    bombs = [Bomb(player) for _ in range(count)]
+    side = int((count * BUSY_SCREEN_AREA) ** 0.5)
+    for obj in enemies + bombs:
+        obj.rect.topleft = (rng.randrange(side), rng.randrange(side))
+    hits = benchmark(resolve_bomb_hits, bombs, enemies, hitbox=hitbox)
+    benchmark.extra_info["hits"] = len(hits)
+
+
+#############################################################################
+
+
+def wave_level(count, entity_store, seed=2):
+    """Level 3 with `count` enemies spread over the screen and the player firing non-stop."""
+    level = create_level(3, seed=seed, entity_store=entity_store)
+    fire = KeyState([pygame.K_SPACE])
+    level.get_pressed = lambda: fire
+    level.spawner.queue.clear()  # Only the wave placed here
+    level.enemies_remaining = None
+    level.player.lives = level.player.ammo = 10 ** 9
+    rng = random.Random(seed)
+    for _ in range(count):
+        level.spawn_enemy()
+        enemy = level.enemies[-1]
+        y = rng.randrange(-SCREEN_HEIGHT, SCREEN_HEIGHT)
+        if entity_store:
+            level.store.y[enemy.row] = y
+        else:
+            enemy.rect.y = y
+    return level
+
+
+@pytest.mark.benchmark(group="entity_store")
+@pytest.mark.parametrize("count", [100, 1000, 10000])
+@pytest.mark.parametrize("variant", ["objects", "entity_store"])
+def test_entity_store(benchmark, screen, count, variant):
+    """30 Level.update ticks of a wave: pooled GameObject lists vs the NumPy entity store."""
+    if variant == "entity_store":
+        pytest.importorskip("numpy")
+    levels = []
+
+    def setup():
+        if levels:
+            levels.pop().close()
+        levels.append(wave_level(count, variant == "entity_store"))
+        return (levels[-1],), {}
+
+    def ticks(level):
+        for _ in range(30):
+            level.update()
+
+    benchmark.pedantic(ticks, setup=setup, rounds=5)
+    levels.pop().close()
+
+
+@pytest.mark.benchmark(group="level_update")
+@pytest.mark.parametrize("count", [10, 100, 500])
+def test_level_update(benchmark, screen, count):
+    """One Level.update tick with N enemies and N bombs on screen.
+
+    Positions and lists are restored before every tick so each one sees
+    the same scene; that reset is part of the measured time.
+    """
+    rng = random.Random(5)
+    level = create_level(3, seed=5)
+    level.get_pressed = lambda: NO_KEYS
+    level.enemies_remaining = None  # keep the level from being won
+    enemies, bombs = [], []
+    for _ in range(count):
+        enemy = EnemyPlane(rng)
+        enemy.rect.top = rng.randrange(SCREEN_HEIGHT // 2)
+        enemies.append((enemy, enemy.rect.topleft))
+        bomb = Bomb(level.player)
+        bomb.rect.topleft = (rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT // 2, SCREEN_HEIGHT))
+        bombs.append((bomb, bomb.rect.topleft))
+
+    def tick():
+        # update() releases culled and destroyed objects to the pools; take
+        # them back out so they are not handed to later spawns, and restore
+        # the scene exactly
+        for pool in (enemy_pool, bomb_pool, ammo_drop_pool):
+            pool.free.clear()
+        for obj, topleft in enemies + bombs:
+            obj.pooled = False
+            obj.previous_position = None
+            obj.remainder[0] = obj.remainder[1] = 0.0
+            obj.rect.topleft = topleft
+        level.enemies = [enemy for enemy, _ in enemies]
+        level.player.bombs = [bomb for bomb, _ in bombs]
+        level.player.lives = 3
+        level.update()
+
+    benchmark(tick)
+
+
+@pytest.mark.benchmark(group="full_level")
+@pytest.mark.parametrize("level_num", [1, 2, 3, 4])
+def test_full_level(benchmark, screen, level_num):
+    """A whole seeded level, headless, with the autopilot flying."""
+    result = benchmark.pedantic(run_headless, (level_num, 60 * 60 * 10), {"seed": 11}, rounds=5)
+    benchmark.extra_info.update(ticks=result.ticks, state=result.state, score=result.score)
+
+
+#############################################################################
+
+
+@pytest.mark.benchmark(group="dirty_rects")
+@pytest.mark.parametrize("dirty", [False, True], ids=["full_flip", "dirty_rects"])
+def test_gameplay_frame(benchmark, screen, dirty):
+    """Gameplay frame draw+present: full flip vs dirty-rect updates."""
+    from level_engine import Level, load_level_spec
+    from renderer import Renderer
+
+    level = Level(None, load_level_spec(3))
+    level.state = "playing"
+    for i in range(6):
+        enemy = EnemyPlane()
+        enemy.rect.topleft = (i * 140, 100)
+        level.enemies.append(enemy)
+    level.renderer = Renderer(level.screen, level.background, dirty_rects=dirty)
+
+    def frame():
+        for enemy in level.enemies:
+            enemy.move()
+            if enemy.rect.top > SCREEN_HEIGHT // 2:
+                enemy.rect.top = 0  # loop the wave so it stays on screen
+        level.draw(level.screen)
+
+    benchmark(frame)
+    level.close()
+
+
+@pytest.mark.benchmark(group="hud")
+@pytest.mark.parametrize("ammo", [7, 40, 200])
+@pytest.mark.parametrize("variant", ["per_icon", "hud", "hud_rebuild"])
+def test_hud(benchmark, screen, ammo, variant):
+    """HUD cost per frame: one blit per heart and bomb vs the cached Hud surface."""
+    from hud import Hud
+    from renderer import Renderer
+
+    heart, bomb = load_photos("lives"), load_photos("bomb")
+    renderer = Renderer(screen, load_background("level_3"))
+    hud = Hud(heart, bomb)
+
+    def per_icon():
+        for i in range(3):
+            renderer.blit(heart, (10 + i * 40, 10))
+        for i in range(ammo):
+            renderer.blit(bomb, (10 + i * 20, 60))
+        renderer.current.clear()
+
+    def cached():
+        hud.draw(renderer, 3, ammo, 1500)
+        renderer.flush()
+        renderer.current.clear()
+
+    def rebuild():
+        hud.values = None  # every frame sees a new score
+        cached()
+
+    benchmark({"per_icon": per_icon, "hud": cached, "hud_rebuild": rebuild}[variant])
+
+
+@pytest.mark.benchmark(group="render_queue")
+@pytest.mark.parametrize("count", [50, 500, 5000])
+@pytest.mark.parametrize("variant", ["per_object", "batched", "batched_untracked"])
+def test_render_queue(benchmark, screen, count, variant):
+    """Drawing N sprites: one blit per GameObject vs RenderQueue batches (one blits call per layer)."""
+    from render_queue import RenderQueue
+
+    rng = random.Random(7)
+    player = PlayerPlane(lambda bomb: None)
+    objects = [cls(rng) if cls is not Bomb else Bomb(player) for cls in (EnemyPlane, Bomb, AmmoDrop)
+               for _ in range(count // 3)]
+    for obj in objects:
+        obj.rect.topleft = (rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT))
+        obj.previous_position = (obj.rect.x, obj.rect.y - 2)
+    objects.sort(key=lambda obj: obj.layer)
+    queue = RenderQueue()
+
+    def per_object():
+        return [screen.blit(obj.sprite, obj.draw_position(0.5)) for obj in objects]
+
+    def batched():
+        queue.submit_objects(objects, 0.5)
+        return queue.flush(screen)
+
+    def batched_untracked():
+        queue.submit_objects(objects, 0.5)
+        queue.flush(screen, track_rects=False)
+
+    benchmark({"per_object": per_object, "batched": batched, "batched_untracked": batched_untracked}[variant])
+
+
+#############################################################################
+
+
+@pytest.mark.benchmark(group="asset_loading")
+@pytest.mark.parametrize("variant", ["inline", "asset_loader"])
+def test_asset_loading(benchmark, screen, variant):
+    """Bringing in a level's assets: loading inline vs AssetLoader.
+
+    The timing is the whole load.  extra_info["stall_ms"] is the longest
+    single block of the main thread, which is what freezes the window.
+    """
+    from assets import AssetLoader
+    from level_engine import level_assets
+    from utils import clear_sound_cache, load_sound
+
+    pygame.mixer.init()
+    assets = level_assets(3)
+    loader = AssetLoader()
+    stalls = []
+
+    def clear():
+        clear_photo_cache()
+        clear_sound_cache()
+
+    def inline():
+        start = time.perf_counter()
+        for kind, name in assets:
+            if kind == "atlas":
+                load_photos("enemy_plane")
+            elif kind == "background":
+                load_background(name)
+            elif kind == "sound":
+                load_sound(name)
+        stalls.append((time.perf_counter() - start) * 1000)
+
+    def preload():
+        batch = loader.preload(assets)
+        while True:
+            start = time.perf_counter()
+            done = loader.poll(batch)
+            stalls.append((time.perf_counter() - start) * 1000)
+            if done:
+                break
+            time.sleep(0.001)  # stands in for the rest of a frame
+
+    benchmark.pedantic(inline if variant == "inline" else preload, setup=clear, rounds=5)
+    loader.shutdown()
+    benchmark.extra_info["stall_ms"] = max(stalls)
+
+
+@pytest.mark.benchmark(group="replay_recording")
+def test_replay_recording(benchmark, screen):
+    """Per-tick cost of recording inputs; extra_info has the bytes written per 1000 ticks."""
+    from headless import ScriptedInput
+    from replay import ReplayRecorder
+
+    script = ScriptedInput([(30, [pygame.K_LEFT, pygame.K_SPACE]), (45, [pygame.K_RIGHT]), (20, [])])
+    level = create_level(3, seed=1)
+    recorder = ReplayRecorder(io.BytesIO(), 3, 1)
+    benchmark(lambda: recorder.record_tick(script(level)))
+    benchmark.extra_info["bytes_per_1000_ticks"] = len(recorder.stream.getvalue()) * 1000 / recorder.ticks
+    level.close()
+
+
+@pytest.mark.benchmark(group="vector_env")
+@pytest.mark.parametrize("processes", [1, 2])
+def test_vector_env(benchmark, processes):
+    """100 batched autopilot steps of 8 environments through SpaceWarshipVectorEnv."""
+    from environment import SpaceWarshipVectorEnv, autopilot_action
+
+    env = SpaceWarshipVectorEnv(8, level_num=4, seed=0, processes=processes)
+    obs = [env.reset()[0]]
+
+    def steps():
+        for _ in range(100):
+            obs[0] = env.step([autopilot_action(o) for o in obs[0]])[0]
+
+    try:
+        benchmark.pedantic(steps, rounds=5)
+    finally:
+        env.close()
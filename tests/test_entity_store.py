@@ -0,0 +1,30 @@
+import pytest
+
+from headless import run_headless
+
+pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("level_num", [1, 2, 3, 4])
+def test_store_backed_level_plays_the_same(screen, level_num, seed):
+    objects = run_headless(level_num, 20000, seed=seed)
+    store = run_headless(level_num, 20000, seed=seed, entity_store=True)
+    assert (store.ticks, store.state, store.score, store.lives) == (
+        objects.ticks, objects.state, objects.score, objects.lives)
+
+
+def test_compaction_keeps_views_on_their_rows(screen):
+    from headless import bot_input, create_level
+
+    level = create_level(4, seed=3, entity_store=True)
+    level.get_pressed = lambda: bot_input(level)
+    for _ in range(3000):
+        level.player.lives = level.player.ammo = 50
+        level.update()
+    store = level.store
+    live = level.enemies + level.player.bombs + level.ammo_drops
+    assert len(store) == len(live)
+    assert all(store.views[view.row] is view for view in live)
+    level.close()
+    assert len(store) == 0 and not any(view.alive for view in live)
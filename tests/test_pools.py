@@ -0,0 +1,27 @@
+from headless import bot_input, create_level
+from models import pool_stats
+from timing import FRAME_DT
+
+
+def test_endless_play_is_served_from_the_pools(screen):
+    """After a minute of endless Level 4, five more minutes build no new entities."""
+    level = create_level(4, seed=3)
+    level.get_pressed = lambda: bot_input(level)
+
+    def play(ticks):
+        for _ in range(ticks):
+            level.player.lives = level.player.ammo = 50
+            level.update(FRAME_DT)
+
+    def totals():
+        stats = pool_stats().values()
+        return sum(s["created"] for s in stats), sum(s["created"] + s["reused"] for s in stats)
+
+    play(3600)
+    created_before, acquired_before = totals()
+    play(18000)
+    created_after, acquired_after = totals()
+    level.close()
+
+    assert acquired_after > acquired_before
+    assert created_after == created_before
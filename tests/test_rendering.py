@@ -0,0 +1,39 @@
+import pytest
+
+from headless import NO_KEYS
+from level_engine import Level, load_level_spec
+from timing import FRAME_DT
+from utils import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def stale_pixels_after(level, state, frames=3):
+    """Draw `level` in `state`, then `frames` playing frames; count pixels a full redraw would change.
+
+    "resuming" runs the real countdown through update() until play resumes.
+    """
+    level.get_pressed = lambda: NO_KEYS
+    if state == "resuming":
+        level.start_resume_countdown()
+        while level.state == "resuming":
+            level.update(FRAME_DT)
+            level.draw(level.screen)
+    else:
+        level.state = state
+        level.draw(level.screen)
+        level.state = "playing"
+    for _ in range(frames):
+        level.draw(level.screen)
+    dirty = level.screen.copy()
+    level.renderer.invalidate()
+    level.draw(level.screen)
+    return sum(1 for x in range(0, SCREEN_WIDTH, 2) for y in range(0, SCREEN_HEIGHT, 2)
+               if dirty.get_at((x, y)) != level.screen.get_at((x, y)))
+
+
+@pytest.mark.parametrize("state", ["waiting", "paused", "resuming"])
+def test_dirty_rects_leave_nothing_behind(screen, state):
+    level = Level(None, load_level_spec(3), seed=1)
+    try:
+        assert stale_pixels_after(level, state) == 0
+    finally:
+        level.close()
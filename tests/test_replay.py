@@ -0,0 +1,67 @@
+import glob
+
+import pygame
+import pytest
+
+from headless import HeadlessGame, bot_input
+from level_engine import Level, load_level_spec
+from replay import Replay, run_replay
+
+
+def click(pos):
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+
+
+def play_recorded(level_num, replay_dir, seed, clicks, max_ticks=20000):
+    """Play a level live with the autopilot while recording it; `clicks` maps tick -> position or callable."""
+    game = HeadlessGame(replay_dir=str(replay_dir))
+    level = Level(game, load_level_spec(level_num), seed)
+    level.get_pressed = lambda: bot_input(level)
+    pygame.event.clear()
+    ticks = 0
+    while level.state not in ("won", "lost") and ticks < max_ticks:
+        if ticks in clicks:
+            pos = clicks[ticks]
+            click(pos(level) if callable(pos) else pos)
+        level.handle_input()
+        if game.scenes.left_by:
+            break
+        level.update()
+        ticks += 1
+    level.close()
+    path, = glob.glob(str(replay_dir / f"level{level_num}_*.swr"))
+    return level, ticks, path
+
+
+@pytest.mark.parametrize("level_num", [1, 2, 3, 4])
+def test_replay_matches_live_run(screen, tmp_path, level_num):
+    clicks = {
+        0: (10, 300),  # start
+        300: lambda level: level.pause_button.center,
+        301: (5, 5),  # ignored while paused
+        302: lambda level: level.resume_button.center,
+    }
+    level, ticks, path = play_recorded(level_num, tmp_path, seed=1000 + level_num, clicks=clicks)
+
+    result = run_replay(path)
+    assert (result.state, result.score, result.lives, result.seed) == (
+        level.state, level.score, level.player.lives, level.seed)
+    assert result.ticks == ticks
+    assert Replay.load(path).ticks == ticks
+
+
+@pytest.mark.parametrize("level_num", [1, 4])
+def test_replay_stops_at_restart(screen, tmp_path, level_num):
+    """Pause then Restart leaves the level; playback ends at that click instead of crashing."""
+    clicks = {
+        0: (10, 300),
+        50: lambda level: level.pause_button.center,
+        60: lambda level: level.restart_button.center,
+    }
+    level, ticks, path = play_recorded(level_num, tmp_path, seed=7, clicks=clicks)
+    assert level.game.scenes.left_by == "switch"
+
+    result = run_replay(path)
+    assert result.left_by == "switch"
+    assert (result.state, result.score, result.lives, result.ticks) == (
+        level.state, level.score, level.player.lives, ticks)
@@ -0,0 +1,113 @@
+import tracemalloc
+import weakref
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+SOAK_GROWTH_KB = 8  # Traced memory the soak may gain after warm-up (allocator and cache churn)
+
+
+def test_scene_transitions_do_not_leak(screen):
+    """Level select -> level -> restart -> next level -> back, 1000 transitions.
+
+    Once the caches have warmed up, neither live levels nor traced memory
+    may grow.
+    """
+    from first import Game
+    from level import LevelPage
+    from level_engine import create_level
+    from scenes import SceneManager
+
+    game = Game()
+    game.scenes = SceneManager(screen)
+    live_levels = weakref.WeakSet()
+
+    def level(num):
+        scene = create_level(num, game)
+        live_levels.add(scene)
+        return scene
+
+    def cycle(num):
+        manager = game.scenes
+        manager.push(lambda: level(num))
+        manager.apply_transitions()
+        manager.current.draw(screen)
+        manager.current.restart()
+        manager.apply_transitions()
+        manager.current.draw(screen)
+        manager.switch(lambda: level(num % 4 + 1))
+        manager.apply_transitions()
+        manager.current.draw(screen)
+        manager.pop()
+        manager.apply_transitions()
+        manager.current.draw(screen)
+
+    game.scenes.push(lambda: LevelPage(game))
+    game.scenes.apply_transitions()
+    tracemalloc.start()
+    try:
+        for i in range(10):
+            cycle(i % 4 + 1)
+        warm_kb, warm_levels = tracemalloc.get_traced_memory()[0] / 1024, len(live_levels)
+        for i in range(240):
+            cycle(i % 4 + 1)
+        last_kb, last_levels = tracemalloc.get_traced_memory()[0] / 1024, len(live_levels)
+    finally:
+        tracemalloc.stop()
+        game.assets.shutdown()
+
+    assert len(game.scenes.stack) == 1
+    assert last_levels <= warm_levels
+    assert last_kb - warm_kb <= SOAK_GROWTH_KB
+
+
+def test_idle_scene_draws_once_then_sleeps(screen):
+    """A game-over screen with no input draws one frame, then waits in pygame.event.wait."""
+    from level_engine import Level, load_level_spec
+    from scenes import SceneManager
+
+    game = SimpleNamespace(scenes=None, replay_dir=None, profiler=None, assets=None)
+    game.scenes = SceneManager(screen)
+    game.scenes.push(lambda: Level(game, load_level_spec(1)))
+    game.scenes.apply_transitions()
+    game.scenes.current.state = "lost"
+    pygame.event.clear()
+    for _ in range(3):
+        game.scenes.step()
+    stats = game.scenes.cpu_stats["Level/lost"]
+    assert stats["frames"] == 3
+    assert stats["draws"] == 1
+    game.scenes.current.close()
+
+
+class ClickLog:
+    """Idle scene that records the positions of the clicks it handles."""
+    idle = True
+
+    def __init__(self):
+        self.clicks = []
+
+    def handle_input(self):
+        self.clicks += [event.pos for event in pygame.event.get() if event.type == pygame.MOUSEBUTTONDOWN]
+
+    def draw(self, screen):
+        pass
+
+
+def test_idle_scene_handles_queued_clicks_in_order(screen, monkeypatch):
+    from scenes import SceneManager
+
+    # pygame 2.6's peek() frees the dict of the event at the head of the
+    # queue, so the loop must never call it
+    monkeypatch.setattr(pygame.event, "peek", lambda *args, **kwargs: pytest.fail("pygame.event.peek called"))
+    manager = SceneManager(screen)
+    scene = ClickLog()
+    manager.push(lambda: scene)
+    manager.apply_transitions()
+    manager.step()  # The first frame always draws
+    pygame.event.clear()
+    for pos in [(1, 1), (2, 2), (3, 3)]:
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+    manager.step()
+    assert scene.clicks == [(1, 1), (2, 2), (3, 3)]